@@ -43,9 +43,13 @@ class TypeaheadAction:
     profile_data: Optional[Dict[str, Any]] = None  # User profile data for context
     frame_id: Optional[str] = None  # Frame ID if not in main frame
 
-@dataclass
+@dataclass(slots=True)
 class ActionContext:
-    """Context for an action execution."""
+    """Context for an action execution.
+
+    Slotted since a form fill builds dozens of contexts per page; attributes
+    outside the declared fields cannot be set on instances.
+    """
     field_id: str  # Can be a selector, or a conceptual ID if type is 'click' and using fallback_text
     field_type: str # e.g., "text", "select", "click", "checkbox", "file"
     field_value: Any # Value to fill/select, or None for click
@@ -214,8 +218,8 @@ class ActionExecutor:
         try:
             # Log start with diagnostics manager if available
             if self.diagnostics_manager:
-                # Use context.__dict__ for logging to avoid issues if context has complex types
-                self.diagnostics_manager.start_action(context.field_type, context.__dict__) # Log context details
+                # Slotted contexts have no __dict__, so log the serialized form
+                self.diagnostics_manager.start_action(context.field_type, context.to_dict()) # Log context details
                 
             self.logger.debug(f"EXECUTOR_CONTEXT_PASS: Passing context object id={id(context)} with field_id='{context.field_id}' to handler {type(handler).__name__}")
 
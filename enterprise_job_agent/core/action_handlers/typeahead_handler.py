@@ -12,6 +12,11 @@ from enterprise_job_agent.core.exceptions import ActionExecutionError, ElementNo
 from .select_handler import SelectActionHandler # Keep this for helpers
 from ..action_strategy_selector import ActionStrategySelector
 
+# Location detection lookups shared by every typeahead action
+# Keyword alternations are substring matches (no word boundaries) since ids like
+# "question_gender_select" join terms with underscores
+_LOCATION_TYPE_RE = re.compile(r"location|city|country|address")
+
 class TypeaheadActionHandler(BaseActionHandler):
     """Handles interactions with typeahead/autocomplete fields."""
     
@@ -57,10 +62,7 @@ class TypeaheadActionHandler(BaseActionHandler):
         try:
             # Decide based on field type - special handling for locations
             # TODO: Improve location field detection (maybe move to FormAnalyzerAgent?)
-            is_location_field = any(k in field_type.lower() for k in ['location', 'city', 'country', 'address']) or \
-                                any(k in field_id.lower() for k in ['location', 'city', 'country', 'address'])
-            
-            if is_location_field:
+            if self._is_location_field(context):
                 self.logger.info(f"Detected location field '{field_id}', using specialized location typeahead handler.")
                 # We could still use strategy selector, but let it return a specific strategy
                 # that delegates to this specialized handler.
@@ -307,30 +309,23 @@ class TypeaheadActionHandler(BaseActionHandler):
 
     # --- Field Type Detection Helpers (Simplified from ActionExecutor) ---
     
-    def _is_location_field(self, field_type, field_id, field_name, field_value) -> bool:
-        """Checks if the field appears to be a location field."""
-        if field_type == "location": return True
-        
-        name_id_combined = f"{(field_id or '').lower()} {(field_name or '').lower()}"
-        if any(term in name_id_combined for term in ["location", "city", "state", "country", "address", "zip", "postal"]):
-            return True
-            
-        # Check value patterns (e.g., "City, ST")
-        if isinstance(field_value, str):
-             if re.search(r"[A-Za-z ]+,\s*[A-Z]{2}\b", field_value):
-                 self.logger.debug(f"Detected location field {field_id} based on city-state pattern in value")
-                 return True
-             # Add other location-like value checks if needed
-             
-        return False
+    def _is_location_field(self, context) -> bool:
+        """Checks if the field described by an ActionContext appears to be a location field.
 
-    # def _is_demographic_field(self, field_type, field_id, field_name) -> bool:
-    #     """Checks if the field appears to be a demographic field."""
-    #     if field_type in ["gender", "race", "ethnicity", "hispanic", "veteran", "disability", "demographic"]:
-    #         return True
-        
-    #     name_id_combined = f"{(field_id or '').lower()} {(field_name or '').lower()}"
-    #     if any(term in name_id_combined for term in ["gender", "race", "ethnicity", "hispanic", "latino", "veteran", "disability", "demographic"]):
-    #         return True
-            
-    #     return False 
\ No newline at end of file
+        Pure and synchronous so callers (and tests) can classify a field without
+        going through the async typeahead interaction. A field counts as a location
+        when its element_data field type or its field id mentions location, city,
+        country or address.
+
+        Args:
+            context: ActionContext for the field
+
+        Returns:
+            True if the field should use the location typeahead logic
+        """
+        element_data = context.options.get("element_data") if context.options else None
+        field_type = (element_data.get("field_type") or "typeahead") if element_data else "typeahead"
+        return bool(
+            _LOCATION_TYPE_RE.search(field_type.lower())
+            or _LOCATION_TYPE_RE.search((context.field_id or "").lower())
+        )
@@ -232,7 +232,7 @@ async def test_discord_application():
             
             # Save profile mapping
             with open(os.path.join(results_dir, "profile_mapping.json"), "w") as f:
-                json.dump([action.__dict__ for action in profile_mapping], f, indent=2)
+                json.dump([action.to_dict() for action in profile_mapping], f, indent=2)
         
         # Execute form filling
         with diagnostics_manager.track_stage("form_execution"):
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import logging
 from pathlib import Path
 
 # Add the project root directory to Python path
@@ -15,6 +16,25 @@ import asyncio
 from enterprise_job_agent.core.browser_manager import BrowserManager
 from enterprise_job_agent.core.diagnostics_manager import DiagnosticsManager
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default asyncio loop
+    uvloop = None
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when available to speed up CDP round-trips."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+@pytest.fixture(autouse=True)
+def quiet_logs(request, caplog):
+    """Keep green runs quiet; opt into verbose output with `--log-cli-level=DEBUG`."""
+    config = request.config
+    if not (config.getoption("log_cli_level") or config.getini("log_cli_level")):
+        caplog.set_level(logging.WARNING)
+
 @pytest.fixture(scope="function") # Can change scope later if needed (e.g., "module")
 async def browser_manager_fixture():
     """Pytest fixture to manage BrowserManager lifecycle for tests."""
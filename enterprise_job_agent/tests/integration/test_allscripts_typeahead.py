@@ -29,6 +29,13 @@ logger = logging.getLogger(__name__)
 # Test URL for Allscripts job application
 TEST_URL = "https://boards.greenhouse.io/embed/job_app?for=allscripts&token=6507210003"
 
+# Confirmation-page patterns, installed once per document so V8 compiles each regex a single time.
+# The post-submit probe accepts bare "received"; the final success check needs "application received".
+CONFIRMATION_INIT_SCRIPT = (
+    "window.__DONE_RE = /thank you|confirmation|submitted|received/;"
+    "window.__SUCCESS_RE = /thank you|confirmation|submitted|application received/;"
+)
+
 async def take_screenshot(page, filename):
     """Take a screenshot and save it in the project root"""
     screenshot_path = Path(__file__).parents[3] / filename
@@ -44,6 +51,7 @@ async def test_allscripts_typeahead_fields():
     try:
         # Initialize browser and navigate to the page
         await browser_manager.initialize()
+        await browser_manager.page.add_init_script(CONFIRMATION_INIT_SCRIPT)
         await browser_manager.navigate(TEST_URL)
         await asyncio.sleep(3)  # Allow page to load fully
         
@@ -330,11 +338,8 @@ async def test_allscripts_typeahead_fields():
                 is_confirmation_page = await browser_manager.page.evaluate("""() => {
                     const pageText = document.body.textContent.toLowerCase();
                     return {
-                        isConfirmation: pageText.includes('thank you') || 
-                                       pageText.includes('confirmation') || 
-                                       pageText.includes('submitted') ||
-                                       pageText.includes('received'),
-                        isError: pageText.includes('error') || pageText.includes('failed')
+                        isConfirmation: window.__DONE_RE.test(pageText),
+                        isError: /error|failed/.test(pageText)
                     };
                 }""")
                 
@@ -389,7 +394,7 @@ async def test_allscripts_typeahead_fields():
         
         if location_field and location_selector:
             logger.info("Testing location typeahead field...")
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             location_context = ActionContext(
                 field_id=location_selector,
@@ -407,8 +412,9 @@ async def test_allscripts_typeahead_fields():
                 except Exception as e:
                     logger.warning(f"Could not get location field value: {e}")
             
-            duration = time.time() - start_time
-            logger.info(f"location field completed in {duration:.2f} seconds with success: {bool(result)}")
+            if logger.isEnabledFor(logging.INFO):
+                duration = time.perf_counter() - start_time
+                logger.info("location field completed in %.2f seconds with success: %s", duration, bool(result))
         else:
             logger.warning("Could not find location field")
         
@@ -514,7 +520,7 @@ async def test_allscripts_typeahead_fields():
                     logger.error(f"Error with token-input approach: {e}")
             else:
                 # Regular typeahead handling
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 school_context = ActionContext(
                     field_id=school_selector,
@@ -524,8 +530,9 @@ async def test_allscripts_typeahead_fields():
                 )
                 result = await action_executor.execute_action(school_context)
                 
-                duration = time.time() - start_time
-                logger.info(f"School field completed in {duration:.2f} seconds with success: {bool(result)}")
+                if logger.isEnabledFor(logging.INFO):
+                    duration = time.perf_counter() - start_time
+                    logger.info("School field completed in %.2f seconds with success: %s", duration, bool(result))
         else:
             logger.warning("Could not find an appropriate school field selector")
         
@@ -580,7 +587,7 @@ async def test_allscripts_typeahead_fields():
         # Test degree field if found
         if degree_selector:
             logger.info("Testing degree field...")
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # If it's a select element, use select type instead of typeahead
             field_type = "select" if degree_selector.startswith("select") else "typeahead"
@@ -593,8 +600,9 @@ async def test_allscripts_typeahead_fields():
             )
             result = await action_executor.execute_action(degree_context)
             
-            duration = time.time() - start_time
-            logger.info(f"Degree field completed in {duration:.2f} seconds with success: {bool(result)}")
+            if logger.isEnabledFor(logging.INFO):
+                duration = time.perf_counter() - start_time
+                logger.info("Degree field completed in %.2f seconds with success: %s", duration, bool(result))
         else:
             logger.warning("Could not find degree field")
         
@@ -650,7 +658,7 @@ async def test_allscripts_typeahead_fields():
         # Test discipline field if found
         if discipline_selector:
             logger.info("Testing discipline field...")
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # If it's a select element, use select type instead of typeahead
             field_type = "select" if discipline_selector.startswith("select") else "typeahead"
@@ -663,8 +671,9 @@ async def test_allscripts_typeahead_fields():
             )
             result = await action_executor.execute_action(discipline_context)
             
-            duration = time.time() - start_time
-            logger.info(f"Discipline field completed in {duration:.2f} seconds with success: {bool(result)}")
+            if logger.isEnabledFor(logging.INFO):
+                duration = time.perf_counter() - start_time
+                logger.info("Discipline field completed in %.2f seconds with success: %s", duration, bool(result))
         else:
             logger.warning("Could not find discipline field")
         
@@ -675,10 +684,7 @@ async def test_allscripts_typeahead_fields():
         test_success = await browser_manager.page.evaluate("""() => {
             // Check if we've reached a thank you/confirmation page
             const pageText = document.body.textContent.toLowerCase();
-            if (pageText.includes('thank you') || 
-                pageText.includes('confirmation') || 
-                pageText.includes('submitted') ||
-                pageText.includes('application received')) {
+            if (window.__SUCCESS_RE.test(pageText)) {
                 return { success: true, message: "Application submitted successfully" };
             }
             
@@ -706,15 +712,18 @@ async def test_allscripts_typeahead_fields():
         logger.info(f"Test evaluation: {test_success}")
         
         # Print test results
-        logger.info("\n===== Allscripts Typeahead Test Results =====")
-        logger.info(f"First Name: {bool(first_name_field)}")
-        logger.info(f"Last Name: {bool(last_name_field)}")
-        logger.info(f"Email: {bool(email_field)}")
-        logger.info(f"Phone: {bool(phone_field)}")
-        logger.info(f"Location: {bool(location_field)}")
-        logger.info(f"School: {bool(school_selector is not None)}")
-        logger.info(f"Degree: {bool(degree_selector is not None)}")
-        logger.info(f"Discipline: {bool(discipline_selector is not None)}")
+        field_results = [
+            ("First Name", first_name_field),
+            ("Last Name", last_name_field),
+            ("Email", email_field),
+            ("Phone", phone_field),
+            ("Location", location_field),
+            ("School", school_selector is not None),
+            ("Degree", degree_selector is not None),
+            ("Discipline", discipline_selector is not None),
+        ]
+        logger.info("\n===== Allscripts Typeahead Test Results =====\n" +
+                    "\n".join(f"{name}: {bool(found)}" for name, found in field_results))
         
         # Overall test result
         if test_success.get('success', False):
@@ -29,6 +29,105 @@ logger = logging.getLogger(__name__)
 # Test URL for Remote.com job application
 TEST_URL = "https://job-boards.greenhouse.io/discord/jobs/7845336002"
 
+# Tag, attributes and classes of the first school input
+SCHOOL_INFO_JS = """
+    () => {
+        const element = document.querySelector("[id*='school']");
+        if (!element) return null;
+
+        return {
+            tag_name: element.tagName.toLowerCase(),
+            attributes: [...element.attributes].reduce((obj, attr) => {
+                obj[attr.name] = attr.value;
+                return obj;
+            }, {}),
+            classes: [...element.classList],
+            selector: element.id ? `#${element.id}` : `[id*='school']`
+        };
+    }
+"""
+
+# React Select container wrapping the school input, if any
+SCHOOL_CONTAINER_JS = """
+    () => {
+        const element = document.querySelector("[id*='school']");
+        if (!element) return null;
+
+        // Look for parent container
+        const container = element.closest('.select__input-container') || 
+                        element.closest('.css-1hwfws3') ||
+                        element.closest('.react-select__value-container');
+
+        if (container) {
+            return {
+                class: container.className,
+                id: container.id || '',
+                role: container.getAttribute('role')
+            };
+        }
+        return null;
+    }
+"""
+
+# Option texts of the currently open dropdown
+DROPDOWN_OPTIONS_JS = """
+    () => {
+        const options = Array.from(document.querySelectorAll('.select__option, .react-select__option, [class*="selectOption"], [role="option"]'))
+            .map(opt => opt.textContent.trim());
+        return options.length ? options : ['No options'];
+    }
+"""
+
+# Opens the degree dropdown and returns its option texts
+DEGREE_OPTIONS_JS = """
+    () => {
+        // Find and click the dropdown to open it
+        const degreeField = document.querySelector("[id*='degree']");
+        if (degreeField) {
+            degreeField.click();
+            // Wait a bit for the dropdown to open
+            return new Promise(resolve => {
+                setTimeout(() => {
+                    const options = Array.from(document.querySelectorAll('.select__option, .react-select__option, [class*="selectOption"], [role="option"]'))
+                        .map(opt => opt.textContent.trim());
+                    resolve(options.length ? options : ['No options']);
+                }, 500);
+            });
+        }
+        return ['No degree field found'];
+    }
+"""
+
+# Opens the discipline/major dropdown and returns its option texts
+DISCIPLINE_OPTIONS_JS = """
+    () => {
+        // Find and click the dropdown to open it
+        const disciplineField = document.querySelector("[id*='discipline'], [id*='major'], [id*='field']");
+        if (disciplineField) {
+            disciplineField.click();
+            // Wait a bit for the dropdown to open
+            return new Promise(resolve => {
+                setTimeout(() => {
+                    const options = Array.from(document.querySelectorAll('.select__option, .react-select__option, [class*="selectOption"], [role="option"]'))
+                        .map(opt => opt.textContent.trim());
+                    resolve(options.length ? options : ['No options']);
+                }, 500);
+            });
+        }
+        return ['No discipline field found'];
+    }
+"""
+
+# Resolves a concrete selector for the discipline/major input
+DISCIPLINE_SELECTOR_JS = """
+    () => {
+        const el = document.querySelector("input[id*='discipline']") || 
+                  document.querySelector("input[id*='major']") || 
+                  document.querySelector("input[id*='field']");
+        return el ? (el.id ? `#${el.id}` : el.outerHTML.substring(0, 100)) : null;
+    }
+"""
+
 async def take_screenshot(page, filename):
     """Take a screenshot and save it in the project root"""
     screenshot_path = Path(__file__).parents[3] / filename
@@ -115,7 +214,7 @@ async def test_remote_typeahead_fields():
         
         if location_field and location_selector:
             logger.info("Testing location typeahead field...")
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             location_context = ActionContext(
                 field_id=location_selector,
@@ -130,8 +229,9 @@ async def test_remote_typeahead_fields():
                 actual_text = await browser_manager.page.locator(location_selector).input_value()
                 logger.info(f"Text actually in location field: '{actual_text}'")
             
-            duration = time.time() - start_time
-            logger.info(f"location field completed in {duration:.2f} seconds with success: {bool(result)}")
+            if logger.isEnabledFor(logging.INFO):
+                duration = time.perf_counter() - start_time
+                logger.info("location field completed in %.2f seconds with success: %s", duration, bool(result))
         
         # Test school typeahead field
         logger.info("Testing school typeahead field...")
@@ -139,42 +239,12 @@ async def test_remote_typeahead_fields():
         # Find school field and analyze its properties
         school_field = await element_selector.find_element("[id*='school']")
         if school_field:
-            school_info = await browser_manager.page.evaluate("""() => {
-                const element = document.querySelector("[id*='school']");
-                if (!element) return null;
-                
-                return {
-                    tag_name: element.tagName.toLowerCase(),
-                    attributes: [...element.attributes].reduce((obj, attr) => {
-                        obj[attr.name] = attr.value;
-                        return obj;
-                    }, {}),
-                    classes: [...element.classList],
-                    selector: element.id ? `#${element.id}` : `[id*='school']`
-                };
-            }""")
+            school_info = await browser_manager.page.evaluate(SCHOOL_INFO_JS)
             
             logger.info(f"School field info: {school_info}")
             
             # Check for container to determine if it's a React Select
-            container_info = await browser_manager.page.evaluate("""() => {
-                const element = document.querySelector("[id*='school']");
-                if (!element) return null;
-                
-                // Look for parent container
-                const container = element.closest('.select__input-container') || 
-                                element.closest('.css-1hwfws3') ||
-                                element.closest('.react-select__value-container');
-                
-                if (container) {
-                    return {
-                        class: container.className,
-                        id: container.id || '',
-                        role: container.getAttribute('role')
-                    };
-                }
-                return null;
-            }""")
+            container_info = await browser_manager.page.evaluate(SCHOOL_CONTAINER_JS)
             
             logger.info(f"School field container: {container_info}")
             
@@ -186,16 +256,12 @@ async def test_remote_typeahead_fields():
             await take_screenshot(browser_manager.page, "remote_school_dropdown.png")
             
             # Get dropdown options
-            dropdown_options = await browser_manager.page.evaluate("""() => {
-                const options = Array.from(document.querySelectorAll('.select__option, .react-select__option, [class*="selectOption"], [role="option"]'))
-                    .map(opt => opt.textContent.trim());
-                return options.length ? options : ['No options'];
-            }""")
+            dropdown_options = await browser_manager.page.evaluate(DROPDOWN_OPTIONS_JS)
             
             logger.info(f"Dropdown options for school field: {dropdown_options[:10]}")
             
             # Execute typeahead for school
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             school_context = ActionContext(
                 field_id=school_info['selector'],
@@ -209,29 +275,15 @@ async def test_remote_typeahead_fields():
             actual_text = await browser_manager.page.locator(school_info['selector']).input_value()
             logger.info(f"Text actually in school field: '{actual_text}'")
             
-            duration = time.time() - start_time
-            logger.info(f"school field completed in {duration:.2f} seconds with success: {bool(result)}")
+            if logger.isEnabledFor(logging.INFO):
+                duration = time.perf_counter() - start_time
+                logger.info("school field completed in %.2f seconds with success: %s", duration, bool(result))
         
         # Test degree typeahead field
         logger.info("Testing degree typeahead field...")
         
         # Check for degree options first
-        degree_options = await browser_manager.page.evaluate("""() => {
-            // Find and click the dropdown to open it
-            const degreeField = document.querySelector("[id*='degree']");
-            if (degreeField) {
-                degreeField.click();
-                // Wait a bit for the dropdown to open
-                return new Promise(resolve => {
-                    setTimeout(() => {
-                        const options = Array.from(document.querySelectorAll('.select__option, .react-select__option, [class*="selectOption"], [role="option"]'))
-                            .map(opt => opt.textContent.trim());
-                        resolve(options.length ? options : ['No options']);
-                    }, 500);
-                });
-            }
-            return ['No degree field found'];
-        }""")
+        degree_options = await browser_manager.page.evaluate(DEGREE_OPTIONS_JS)
         
         logger.info(f"Available degree options: {degree_options[:10]}")
         
@@ -240,7 +292,7 @@ async def test_remote_typeahead_fields():
         
         degree_field = await element_selector.find_element("[id*='degree']")
         if degree_field:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             degree_context = ActionContext(
                 field_id="input[id*='degree']",
@@ -254,29 +306,15 @@ async def test_remote_typeahead_fields():
             actual_text = await browser_manager.page.locator("input[id*='degree']").input_value()
             logger.info(f"Text actually in degree field: '{actual_text}'")
             
-            duration = time.time() - start_time
-            logger.info(f"degree field completed in {duration:.2f} seconds with success: {bool(result)}")
+            if logger.isEnabledFor(logging.INFO):
+                duration = time.perf_counter() - start_time
+                logger.info("degree field completed in %.2f seconds with success: %s", duration, bool(result))
         
         # Test discipline typeahead field
         logger.info("Testing discipline typeahead field...")
         
         # Check for discipline options
-        discipline_options = await browser_manager.page.evaluate("""() => {
-            // Find and click the dropdown to open it
-            const disciplineField = document.querySelector("[id*='discipline'], [id*='major'], [id*='field']");
-            if (disciplineField) {
-                disciplineField.click();
-                // Wait a bit for the dropdown to open
-                return new Promise(resolve => {
-                    setTimeout(() => {
-                        const options = Array.from(document.querySelectorAll('.select__option, .react-select__option, [class*="selectOption"], [role="option"]'))
-                            .map(opt => opt.textContent.trim());
-                        resolve(options.length ? options : ['No options']);
-                    }, 500);
-                });
-            }
-            return ['No discipline field found'];
-        }""")
+        discipline_options = await browser_manager.page.evaluate(DISCIPLINE_OPTIONS_JS)
         
         logger.info(f"Available discipline options: {discipline_options[:10]}")
         
@@ -285,15 +323,10 @@ async def test_remote_typeahead_fields():
         
         discipline_field = await element_selector.find_element("input[id*='discipline'], input[id*='major'], input[id*='field']")
         if discipline_field:
-            discipline_selector = await browser_manager.page.evaluate("""() => {
-                const el = document.querySelector("input[id*='discipline']") || 
-                          document.querySelector("input[id*='major']") || 
-                          document.querySelector("input[id*='field']");
-                return el ? (el.id ? `#${el.id}` : el.outerHTML.substring(0, 100)) : null;
-            }""")
+            discipline_selector = await browser_manager.page.evaluate(DISCIPLINE_SELECTOR_JS)
             
             if discipline_selector:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 discipline_context = ActionContext(
                     field_id=discipline_selector,
@@ -310,15 +343,19 @@ async def test_remote_typeahead_fields():
                 except Exception as e:
                     logger.warning(f"Could not get discipline field value: {e}")
                 
-                duration = time.time() - start_time
-                logger.info(f"discipline field completed in {duration:.2f} seconds with success: {bool(result)}")
+                if logger.isEnabledFor(logging.INFO):
+                    duration = time.perf_counter() - start_time
+                    logger.info("discipline field completed in %.2f seconds with success: %s", duration, bool(result))
         
         # Print test results
-        logger.info("\n===== Remote.com Typeahead Test Results =====")
-        logger.info(f"Location: {bool(location_field)}")
-        logger.info(f"School: {bool(school_field)}")
-        logger.info(f"Degree: {bool(degree_field)}")
-        logger.info(f"Discipline: {bool(discipline_field)}")
+        field_results = [
+            ("Location", location_field),
+            ("School", school_field),
+            ("Degree", degree_field),
+            ("Discipline", discipline_field),
+        ]
+        logger.info("\n===== Remote.com Typeahead Test Results =====\n" +
+                    "\n".join(f"{name}: {bool(found)}" for name, found in field_results))
         
         logger.info("Test completed!")
         
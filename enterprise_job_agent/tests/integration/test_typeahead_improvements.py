@@ -23,7 +23,7 @@ from enterprise_job_agent.tools.field_identifier import FieldDetector
 
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[logging.StreamHandler()]
 )
@@ -33,26 +33,312 @@ logger = logging.getLogger(__name__)
 # Test URL for Discord job application
 TEST_URL = "https://job-boards.greenhouse.io/discord/jobs/7845336002"
 
-@pytest_asyncio.fixture
+# Short Playwright timeouts so a missing element fails fast instead of after 30s
+DEFAULT_TIMEOUT_MS = 3000
+NAVIGATION_TIMEOUT_MS = 5000
+PROBE_TIMEOUT_S = 2.0
+
+# Installed once per document via add_init_script so the option selector list is
+# parsed a single time; defines window.__probeDropdown() returning option texts
+DROPDOWN_PROBE_JS = """
+    (() => {
+        // Try various selectors for dropdown options
+        const optionSelectors = [
+            'div[role="listbox"] div[role="option"]',
+            'ul[role="listbox"] li[role="option"]',
+            '.select__menu .select__option',
+            '.select__menu-list .select__option',
+            'ul.dropdown-menu li',
+            'div.dropdown-list div.dropdown-option',
+            'li[id^="react-select"]',
+            'div[class*="option"]'
+        ];
+        window.__probeDropdown = () => {
+            for (const optionSelector of optionSelectors) {
+                const options = document.querySelectorAll(optionSelector);
+                if (options.length > 0) {
+                    return Array.from(options, opt => opt.textContent.trim());
+                }
+            }
+            // Last resort: get all visible list items
+            return Array.from(document.querySelectorAll('li:not([style*="display: none"])'), li => li.textContent.trim());
+        };
+    })();
+"""
+
+# Installed alongside DROPDOWN_PROBE_JS; defines window.__verifyFilled(selector, keywords)
+# which checks the input value, its React-Select container, up to three parents
+# and finally any visible element for one of the keywords
+VERIFY_FILLED_JS = """
+    (() => {
+        window.__verifyFilled = (selector, keywords) => {
+            const el = document.querySelector(selector);
+            if (!el) return false;
+
+            const needles = keywords.map(keyword => keyword.toLowerCase());
+            const hasKeyword = text => !!text && needles.some(needle => text.toLowerCase().includes(needle));
+
+            // First check actual value property - most reliable
+            if (hasKeyword(el.value)) return true;
+
+            // Check if it's in a React select container
+            const container = el.closest('.select__control') || el.closest('div[class*="select"]');
+            if (container) {
+                const valueElements = container.querySelectorAll(
+                    '.select__single-value, div[class*="singleValue"], div[class*="value"], div > span, div'
+                );
+                if (Array.from(valueElements).some(valueEl => hasKeyword(valueEl.textContent))) return true;
+            }
+
+            // Walk up to 3 parents once, collecting nearby text
+            const nearbyTexts = [];
+            let parent = el;
+            for (let i = 0; i < 3 && (parent = parent.parentElement); i++) {
+                for (const element of parent.querySelectorAll('div, span, p')) {
+                    nearbyTexts.push(element.textContent);
+                }
+            }
+            if (nearbyTexts.some(hasKeyword)) return true;
+
+            // Check document for any visible element with the keyword
+            return Array.from(document.querySelectorAll('div, span, p'))
+                .some(element => element.offsetParent !== null && hasKeyword(element.textContent));
+        };
+    })();
+"""
+
+LOCATION_FILLED_JS = """
+    () => {
+        const el = document.querySelector("input[id*='location']");
+        return el ? (el.value || "").toLowerCase().includes("francisco") : false;
+    }
+"""
+
+# Reads a field's value from multiple sources for debugging a failed verification
+FIELD_STATE_JS = """
+    ([selector, keyword]) => {
+        const el = document.querySelector(selector);
+        if (!el) return "Element not found";
+        
+        return {
+            value: el.value || "",
+            // Check if text was actually entered in the input
+            directTextEntry: (el.value || "").toLowerCase().includes(keyword),
+            // Check React select container state
+            reactSelectedValue: (() => {
+                const container = el.closest('.select__control') || el.closest('div[class*="select"]');
+                if (!container) return "No container found";
+                const valueEl = container.querySelector('.select__single-value, div[class*="value"], span');
+                return valueEl ? valueEl.textContent : "No value element found";
+            })()
+        };
+    }
+"""
+
+# Bit flags returned by FIELD_FLAGS_JS
+FIELD_DIRECT_ENTRY = 1
+FIELD_REACT_SELECTED = 2
+
+# Packs a field's fill state into an int bitmask: FIELD_DIRECT_ENTRY when the
+# input text contains the keyword, FIELD_REACT_SELECTED when the React Select
+# single-value does; 0 if the element is missing
+FIELD_FLAGS_JS = """
+    ([selector, keyword]) => {
+        const el = document.querySelector(selector);
+        if (!el) return 0;
+        let flags = (el.value || "").toLowerCase().includes(keyword) ? 1 : 0;
+        const container = el.closest('.select__control');
+        if (container) {
+            const valueEl = container.querySelector('.select__single-value');
+            if (valueEl && valueEl.textContent.toLowerCase().includes(keyword)) flags |= 2;
+        }
+        return flags;
+    }
+"""
+
+# Combines the location/school/degree/discipline checks and the school/degree
+# value diagnostics so verification costs one CDP round-trip
+POST_FILL_CHECKS_JS = f"""
+    () => {{
+        const fieldState = {FIELD_STATE_JS};
+        const fieldFlags = {FIELD_FLAGS_JS};
+        return {{
+            location: ({LOCATION_FILLED_JS})(),
+            school: window.__verifyFilled("#school--0", ["berkeley"]),
+            degree: window.__verifyFilled("#degree--0", ["bachelor"]),
+            discipline: window.__verifyFilled("#discipline--0", ["computer"]),
+            schoolState: fieldState(["#school--0", "berkeley"]),
+            degreeFlags: fieldFlags(["#degree--0", "bachelor"])
+        }};
+    }}
+"""
+
+RESET_FORM_JS = "() => document.querySelector('form')?.reset()"
+
+# '#id' selector for an element handle, or null when it has no id
+ELEMENT_ID_SELECTOR_JS = "el => el.id ? `#${CSS.escape(el.id)}` : null"
+
+# Opens each dropdown in turn and returns its option texts keyed by selector
+OPTION_LISTS_JS = """
+    async (fieldSelectors) => {
+        const results = {};
+        for (const fieldSelector of fieldSelectors) {
+            const field = document.querySelector(fieldSelector);
+            if (!field) {
+                results[fieldSelector] = [];
+                continue;
+            }
+            // Click the field to open the dropdown and wait (up to 1s) for a listbox to appear
+            field.click();
+            await new Promise(resolve => {
+                if (document.querySelector('[role="listbox"]')) return resolve();
+                const observer = new MutationObserver(() => {
+                    if (document.querySelector('[role="listbox"]')) {
+                        observer.disconnect();
+                        resolve();
+                    }
+                });
+                observer.observe(document.body, { childList: true, subtree: true });
+                setTimeout(() => {
+                    observer.disconnect();
+                    resolve();
+                }, 1000);
+            });
+            results[fieldSelector] = window.__probeDropdown();
+        }
+        return results;
+    }
+"""
+
+# Collects everything the typeahead test inspects about a field in one evaluate round-trip
+PROBE_FIELD_JS = """
+    ([selector, keyword]) => {
+        const element = document.querySelector(selector);
+        if (!element) return null;
+
+        // Closest parent div that might be a Select container
+        const container = element.closest('div[class*="select"]');
+
+        const dropdownOptions = window.__probeDropdown();
+
+        // For select elements use the selected option text, otherwise the input value
+        let inputValue = element.value || "";
+        if (element.tagName === "SELECT") {
+            const option = element.options[element.selectedIndex];
+            inputValue = option ? option.text : "";
+        }
+
+        // React-Select components keep the displayed value outside the input
+        let reactValue = null;
+        const valueContainer = element.closest('div[class*="container"]');
+        if (valueContainer) {
+            const valueEls = valueContainer.querySelectorAll('div[class*="singleValue"], div[class*="value"]');
+            if (valueEls.length > 0) {
+                reactValue = Array.from(valueEls, el => el.textContent.trim()).join(", ");
+            }
+        }
+
+        const needle = (keyword || "").toLowerCase();
+        return {
+            tagName: element.tagName.toLowerCase(),
+            attrs: Object.fromEntries(Array.from(element.attributes, attr => [attr.name, attr.value])),
+            classes: Array.from(element.classList),
+            containerClass: container ? container.className : null,
+            containerRole: container ? container.getAttribute('role') : null,
+            dropdownOptions: dropdownOptions,
+            inputValue: inputValue,
+            reactValue: reactValue,
+            matched: needle !== "" && `${inputValue} ${reactValue || ""}`.toLowerCase().includes(needle)
+        };
+    }
+"""
+
+async def install_probes(browser_manager):
+    """Install the shared JS probes; call once per page, as init scripts accumulate."""
+    await browser_manager.page.add_init_script(DROPDOWN_PROBE_JS)
+    await browser_manager.page.add_init_script(VERIFY_FILLED_JS)
+
+async def open_test_page(browser_manager):
+    """Navigate to the test page and wait for the form; the probes must already be installed."""
+    browser_manager.page.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    browser_manager.page.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+    await browser_manager.navigate(TEST_URL)
+    await wait_for_form(browser_manager)
+
+async def probe_field(browser_manager, selector, keyword):
+    """Run PROBE_FIELD_JS on a field, giving up after PROBE_TIMEOUT_S."""
+    try:
+        return await asyncio.wait_for(
+            browser_manager.page.main_frame.evaluate(PROBE_FIELD_JS, [selector, keyword]),
+            timeout=PROBE_TIMEOUT_S
+        )
+    except asyncio.TimeoutError:
+        logger.warning("Probe of %s timed out after %.1fs", selector, PROBE_TIMEOUT_S)
+        return None
+
+async def wait_for_form(browser_manager):
+    """Wait until the application form is actionable instead of sleeping a fixed time."""
+    await browser_manager.page.wait_for_load_state("networkidle", timeout=NAVIGATION_TIMEOUT_MS)
+    await browser_manager.page.wait_for_selector("#first_name", state="visible", timeout=NAVIGATION_TIMEOUT_MS)
+
+# Debug artifacts (screenshots, DOM dumps) are only produced with DEBUG logging
+# and JOB_AGENT_TEST_TRACE set, keeping them off the default test path
+_trace_tasks = set()
+
+def trace_enabled():
+    """Return True when debug screenshots and DOM dumps should be captured."""
+    return logger.isEnabledFor(logging.DEBUG) and bool(os.environ.get("JOB_AGENT_TEST_TRACE"))
+
+def trace_screenshot(browser_manager, path):
+    """Take a debug screenshot in the background without blocking the test flow.
+    
+    The task is kept until drain_trace_tasks() awaits it before the browser closes.
+    """
+    _trace_tasks.add(asyncio.create_task(browser_manager.take_screenshot(str(path))))
+
+async def drain_trace_tasks():
+    """Wait for pending debug screenshots, logging any that failed."""
+    tasks = list(_trace_tasks)
+    _trace_tasks.clear()
+    for result in await asyncio.gather(*tasks, return_exceptions=True):
+        if isinstance(result, Exception):
+            logger.warning("Debug screenshot failed: %s", result)
+
+def build_test_tools(browser_manager):
+    """Create the field detector and action executor shared by the tests."""
+    field_detector = FieldDetector(browser_manager)
+    action_executor = ActionExecutor(
+        browser_manager=browser_manager,
+        form_interaction=browser_manager.form_interaction,
+        element_selector=browser_manager.element_selector,
+        test_mode=False
+    )
+    return field_detector, action_executor
+
+async def reset_form(browser_manager):
+    """Reset the already-loaded form instead of paying for a fresh navigation."""
+    await browser_manager.page.evaluate(RESET_FORM_JS)
+
+@pytest_asyncio.fixture(scope="module")
 async def browser_manager_fixture():
-    """Create and initialize a browser manager for testing."""
+    """Create a browser manager on the loaded test page plus shared detector/executor.
+    
+    The page is navigated once per module and the browser is closed once at the end.
+    """
     browser_manager = BrowserManager(visible=True)
     await browser_manager.initialize()
-    yield browser_manager
+    await install_probes(browser_manager)
+    await open_test_page(browser_manager)
+    yield (browser_manager, *build_test_tools(browser_manager))
+    await drain_trace_tasks()
     await browser_manager.close()
 
-@pytest.mark.asyncio
-async def test_field_detection(browser_manager):
+@pytest.mark.asyncio(scope="module")
+async def test_field_detection(browser_manager_fixture):
     """Test the improved field detection capabilities."""
+    browser_manager, field_detector, _ = browser_manager_fixture
     logger.info("Starting field detection test...")
     
-    # Navigate to the test page
-    await browser_manager.navigate(TEST_URL)
-    await asyncio.sleep(3)  # Allow page to load fully
-    
-    # Create field detector
-    field_detector = FieldDetector(browser_manager)
-    
     # Define test cases for field detection
     test_cases = [
         # Personal information fields
@@ -71,185 +357,97 @@ async def test_field_detection(browser_manager):
         {"name": "invalid input", "should_find": False},
     ]
     
+    # Look up every field concurrently; the queries are read-only and independent
+    found_fields = await asyncio.gather(*[
+        field_detector.find_field_by_name(case["name"]) for case in test_cases
+    ])
+    
     # Test each case
-    for case in test_cases:
+    for case, field_info in zip(test_cases, found_fields):
         field_name = case["name"]
         should_find = case["should_find"]
         
-        logger.info(f"Testing field detection for: '{field_name}'")
-        field_info = await field_detector.find_field_by_name(field_name)
+        logger.info("Testing field detection for: %r", field_name)
         
         if should_find:
             assert field_info is not None, f"Should have found field '{field_name}'"
-            logger.info(f"Found field '{field_name}' with selector: {field_info.selector}")
+            logger.info("Found field %r with selector: %s", field_name, field_info.selector)
         else:
             assert field_info is None, f"Should NOT have found field '{field_name}'"
-            logger.info(f"Correctly did not find nonexistent field '{field_name}'")
+            logger.info("Correctly did not find nonexistent field %r", field_name)
     
     # Analyze detected fields
     for field_name in ["first name", "email", "school", "degree"]:
         field_info = await field_detector.find_field_by_name(field_name)
         if field_info:
-            logger.info(f"Field '{field_name}' properties:")
-            logger.info(f"  Type: {field_info.field_type}")
-            logger.info(f"  Required: {field_info.required}")
-            logger.info(f"  Label: {field_info.label}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Field %r properties:\n  Type: %s\n  Required: %s\n  Label: %s",
+                             field_name, field_info.field_type, field_info.required, field_info.label)
             
             # Get dropdown options for select fields
             if field_info.field_type in ["select", "typeahead"]:
                 options = await field_detector.get_dropdown_options(field_info.selector)
-                logger.info(f"  Options: {options[:5]} ({'...' if len(options) > 5 else ''})")
+                logger.info("  Options: %s (%s)", options[:5], '...' if len(options) > 5 else '')
     
     logger.info("Field detection test completed successfully!")
 
-@pytest.mark.asyncio
-async def test_typeahead_improvements(browser_manager):
+@pytest.mark.asyncio(scope="module")
+async def test_typeahead_improvements(browser_manager_fixture):
     """Test improved typeahead handling capabilities."""
+    browser_manager, field_detector, action_executor = browser_manager_fixture
     logger.info("Starting typeahead improvement test...")
     
-    # Navigate to the test page
-    await browser_manager.navigate(TEST_URL)
-    await asyncio.sleep(3)  # Allow page to load fully
-    
-    # Get tools from browser manager
-    element_selector = browser_manager.element_selector
-    form_interaction = browser_manager.form_interaction
-    
-    # Create action executor
-    action_executor = ActionExecutor(
-        browser_manager=browser_manager,
-        form_interaction=form_interaction,
-        element_selector=element_selector,
-        test_mode=False
-    )
+    # Start from a clean form on the page loaded by the fixture
+    await reset_form(browser_manager)
     
-    # Fill standard fields first
+    # Fill standard fields first, one at a time: typing goes to whichever field has focus
     logger.info("Filling standard fields first...")
-    
-    # Fill first name
-    await action_executor.execute_action(ActionContext(
-        field_id="#first_name",
-        field_type="text",
-        field_value="Test",
-        field_name="first name"
-    ))
-    
-    # Fill last name
-    await action_executor.execute_action(ActionContext(
-        field_id="#last_name",
-        field_type="text",
-        field_value="User",
-        field_name="last name"
-    ))
-    
-    # Fill email
-    await action_executor.execute_action(ActionContext(
-        field_id="#email",
-        field_type="text",
-        field_value="test.user@example.com",
-        field_name="email"
-    ))
-    
-    # Fill phone
-    await action_executor.execute_action(ActionContext(
-        field_id="#phone",
-        field_type="text",
-        field_value="555-123-4567",
-        field_name="phone"
-    ))
+    standard_fields = [
+        ("#first_name", "Test", "first name"),
+        ("#last_name", "User", "last name"),
+        ("#email", "test.user@example.com", "email"),
+        ("#phone", "555-123-4567", "phone"),
+    ]
+    for selector, value, name in standard_fields:
+        await action_executor.execute_action(ActionContext(
+            field_id=selector,
+            field_type="text",
+            field_value=value,
+            field_name=name
+        ))
     
     # Function to test and time typeahead field filling
     async def test_typeahead_field(field_selector, field_name, value):
-        logger.info(f"Testing {field_name} typeahead field...")
+        logger.info("Testing %s typeahead field...", field_name)
         
         # Check if field exists
         element = await browser_manager.page.main_frame.query_selector(field_selector)
         if not element:
-            logger.warning(f"{field_name} field selector '{field_selector}' not found!")
+            logger.warning("%s field selector %r not found!", field_name, field_selector)
             # Try to use field detection to find it
-            field_detector = FieldDetector(browser_manager)
             field_info = await field_detector.find_field_by_name(field_name)
             if field_info:
                 field_selector = field_info.selector
-                logger.info(f"Found {field_name} field with alternate selector: {field_selector}")
+                logger.info("Found %s field with alternate selector: %s", field_name, field_selector)
             else:
-                logger.error(f"Could not find {field_name} field!")
+                logger.error("Could not find %s field!", field_name)
                 return False, 0
         
-        # For school field, log detailed info to debug
-        if field_name == "school":
-            field_info = await browser_manager.page.main_frame.evaluate(f"""
-                (selector) => {{
-                    const element = document.querySelector(selector);
-                    if (!element) return null;
-                    
-                    return {{
-                        tag_name: element.tagName.toLowerCase(),
-                        attributes: Object.fromEntries(
-                            Array.from(element.attributes).map(attr => [attr.name, attr.value])
-                        ),
-                        classes: Array.from(element.classList),
-                        selector: selector
-                    }};
-                }}
-            """, field_selector)
-            logger.info(f"School field info: {field_info}")
-            
-            # Try to find the containing div
-            container = await browser_manager.page.main_frame.evaluate(f"""
-                (selector) => {{
-                    const element = document.querySelector(selector);
-                    if (!element) return null;
-                    
-                    // Find closest parent div that might be a Select container
-                    let container = element.closest('div[class*="select"]');
-                    if (container) {{
-                        return {{
-                            class: container.className,
-                            id: container.id,
-                            role: container.getAttribute('role')
-                        }};
-                    }}
-                    return null;
-                }}
-            """, field_selector)
-            logger.info(f"School field container: {container}")
+        # For school field, log detailed info to debug (only when tracing)
+        if field_name == "school" and trace_enabled():
+            probe = await probe_field(browser_manager, field_selector, None)
+            logger.debug("School field info: %s", probe)
             
             # Take a screenshot of the dropdown area
             screenshot_path = Path("school_dropdown.png")
-            await browser_manager.take_screenshot(str(screenshot_path))
-            logger.info(f"Took screenshot of school dropdown at {screenshot_path.absolute()}")
+            trace_screenshot(browser_manager, screenshot_path)
+            logger.debug("Taking screenshot of school dropdown at %s", screenshot_path.absolute())
             
-            # Try to get dropdown options
-            dropdown_options = await browser_manager.page.main_frame.evaluate(f"""
-                () => {{
-                    // Try various selectors for dropdown options
-                    const selectors = [
-                        'div[role="listbox"] div[role="option"]',
-                        'ul[role="listbox"] li[role="option"]',
-                        '.select__menu .select__option',
-                        '.select__menu-list .select__option',
-                        'ul.dropdown-menu li',
-                        'div.dropdown-list div.dropdown-option',
-                        'li[id^="react-select"]',
-                        'div[class*="option"]'
-                    ];
-                    
-                    for (const selector of selectors) {{
-                        const options = Array.from(document.querySelectorAll(selector));
-                        if (options.length > 0) {{
-                            return options.map(opt => opt.textContent.trim());
-                        }}
-                    }}
-                    
-                    // Last resort: get all visible list items
-                    return Array.from(document.querySelectorAll('li:not([style*="display: none"])')).map(li => li.textContent.trim());
-                }}
-            """)
-            logger.info(f"Dropdown options for {field_name} field: {dropdown_options[:10]}")
+            if probe:
+                logger.info("Dropdown options for %s field: %s", field_name, probe['dropdownOptions'][:10])
         
         # Time the typeahead filling
-        start_time = time.time()
+        start_time = time.perf_counter()
         success = False
         
         try:
@@ -264,82 +462,51 @@ async def test_typeahead_improvements(browser_manager):
             # Execute the typeahead action
             success = await action_executor.execute_action(context)
         except Exception as e:
-            logger.error(f"Error filling {field_name} field: {str(e)}")
+            logger.error("Error filling %s field: %s", field_name, e)
             success = False
             
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         
         # Check actual text in field after filling
         try:
-            actual_value = await browser_manager.page.main_frame.evaluate(f"""
-                (selector) => {{
-                    const element = document.querySelector(selector);
-                    if (!element) return "";
-                    if (element.tagName === "SELECT") {{
-                        // For select elements, get the selected option text
-                        const option = element.options[element.selectedIndex];
-                        return option ? option.text : "";
-                    }}
-                    // For input elements
-                    return element.value || "";
-                }}
-            """, field_selector)
-            logger.info(f"Text actually in {field_name} field: '{actual_value}'")
-            
-            # Check if selection was actually made for typeahead fields
-            if field_name in ["school", "degree", "discipline"]:
+            probe = await probe_field(browser_manager, field_selector, value)
+            if probe:
+                logger.info("Text actually in %s field: %r", field_name, probe['inputValue'])
+                
                 # For React-Select components, sometimes the value is stored differently
-                react_value = await browser_manager.page.main_frame.evaluate(f"""
-                    (selector) => {{
-                        // Try to find the hidden input that might store the actual value
-                        const container = document.querySelector(selector).closest('div[class*="container"]');
-                        if (!container) return null;
-                        
-                        // Look for any elements with text that might represent the selected value
-                        const valueEls = container.querySelectorAll('div[class*="singleValue"], div[class*="value"]');
-                        if (valueEls.length > 0) {{
-                            return Array.from(valueEls).map(el => el.textContent.trim()).join(", ");
-                        }}
-                        return null;
-                    }}
-                """, field_selector)
-                if react_value:
-                    logger.info(f"React component value for {field_name}: '{react_value}'")
+                if field_name in ["school", "degree", "discipline"] and probe["reactValue"]:
+                    logger.info("React component value for %s: %r", field_name, probe['reactValue'])
         except Exception as e:
-            logger.error(f"Error getting actual value for {field_name}: {str(e)}")
+            logger.error("Error getting actual value for %s: %s", field_name, e)
         
-        logger.info(f"{field_name} field completed in {elapsed_time:.2f} seconds with success: {success}")
+        logger.info("%s field completed in %.2f seconds with success: %s", field_name, elapsed_time, success)
         return success, elapsed_time
     
     # Test each typeahead field
     logger.info("Testing typeahead field handling...")
     
+    # Check which degree and discipline options are actually available in one round-trip
+    option_lists = await browser_manager.page.main_frame.evaluate(
+        OPTION_LISTS_JS, ["#degree--0", "#discipline--0"]
+    )
+    
     # Test location field
-    # Note: Try alternative selectors for location field if the original one doesn't work
-    location_selectors = [
-        "#location", 
-        "input[name='location']", 
-        "input[id*='location']", 
-        "input[placeholder*='location']"
-    ]
+    # Note: alternative selectors are grouped so the first match in document order is found in one query
+    location_selector = "#location, input[name='location'], input[id*='location'], input[placeholder*='location']"
     
     location_success = False
     location_time = 0
     
-    # Try each possible location selector
-    for selector in location_selectors:
-        logger.info(f"Trying location selector: {selector}")
-        element = await browser_manager.page.main_frame.query_selector(selector)
-        if element:
-            logger.info(f"Found location field with selector: {selector}")
-            location_success, location_time = await test_typeahead_field(selector, "location", "San Francisco, CA")
-            if location_success:
-                break
+    element = await browser_manager.page.main_frame.query_selector(location_selector)
+    if element:
+        # Narrow the grouped selector down to the matched element when it has an id
+        selector = await element.evaluate(ELEMENT_ID_SELECTOR_JS) or location_selector
+        logger.info("Found location field with selector: %s", selector)
+        location_success, location_time = await test_typeahead_field(selector, "location", "San Francisco, CA")
     
     # If all selectors fail, try field detection
     if not location_success:
         logger.info("Trying field detection for location")
-        field_detector = FieldDetector(browser_manager)
         field_info = await field_detector.find_field_by_name("location")
         if field_info:
             location_success, location_time = await test_typeahead_field(field_info.selector, "location", "San Francisco, CA")
@@ -350,45 +517,8 @@ async def test_typeahead_improvements(browser_manager):
     # Test degree field
     logger.info("Testing degree typeahead field...")
     
-    # First check what degree options are actually available
-    degree_options = await browser_manager.page.main_frame.evaluate(f"""
-        () => {{
-            // First try to click the degree field to open the dropdown
-            const degreeField = document.querySelector('#degree--0');
-            if (degreeField) {{
-                degreeField.click();
-                // Wait briefly for dropdown to appear
-                return new Promise(resolve => {{
-                    setTimeout(() => {{
-                        // Try various selectors for dropdown options
-                        const selectors = [
-                            'div[role="listbox"] div[role="option"]',
-                            'ul[role="listbox"] li[role="option"]',
-                            '.select__menu .select__option',
-                            '.select__menu-list .select__option',
-                            'ul.dropdown-menu li',
-                            'div.dropdown-list div.dropdown-option',
-                            'li[id^="react-select"]',
-                            'div[class*="option"]'
-                        ];
-                        
-                        for (const selector of selectors) {{
-                            const options = Array.from(document.querySelectorAll(selector));
-                            if (options.length > 0) {{
-                                resolve(options.map(opt => opt.textContent.trim()));
-                                return;
-                            }}
-                        }}
-                        
-                        // Last resort: get all visible list items
-                        resolve(Array.from(document.querySelectorAll('li:not([style*="display: none"])')).map(li => li.textContent.trim()));
-                    }}, 500);
-                }});
-            }}
-            return [];
-        }}
-    """)
-    logger.info(f"Available degree options: {degree_options}")
+    degree_options = option_lists.get("#degree--0", [])
+    logger.info("Available degree options: %s", degree_options)
     
     # Use a valid degree option if available, otherwise use the default
     degree_value = "Bachelor of Science"
@@ -396,52 +526,15 @@ async def test_typeahead_improvements(browser_manager):
         valid_options = [opt for opt in degree_options if opt.lower().startswith("bachelor")]
         if valid_options:
             degree_value = valid_options[0]
-            logger.info(f"Using valid degree option from dropdown: '{degree_value}'")
+            logger.info("Using valid degree option from dropdown: '%s'", degree_value)
     
     degree_success, degree_time = await test_typeahead_field("#degree--0", "degree", degree_value)
     
     # Test discipline/major field
     logger.info("Testing discipline typeahead field...")
     
-    # First check what discipline options are actually available
-    discipline_options = await browser_manager.page.main_frame.evaluate(f"""
-        () => {{
-            // First try to click the discipline field to open the dropdown
-            const disciplineField = document.querySelector('#discipline--0');
-            if (disciplineField) {{
-                disciplineField.click();
-                // Wait briefly for dropdown to appear
-                return new Promise(resolve => {{
-                    setTimeout(() => {{
-                        // Try various selectors for dropdown options
-                        const selectors = [
-                            'div[role="listbox"] div[role="option"]',
-                            'ul[role="listbox"] li[role="option"]',
-                            '.select__menu .select__option',
-                            '.select__menu-list .select__option',
-                            'ul.dropdown-menu li',
-                            'div.dropdown-list div.dropdown-option',
-                            'li[id^="react-select"]',
-                            'div[class*="option"]'
-                        ];
-                        
-                        for (const selector of selectors) {{
-                            const options = Array.from(document.querySelectorAll(selector));
-                            if (options.length > 0) {{
-                                resolve(options.map(opt => opt.textContent.trim()));
-                                return;
-                            }}
-                        }}
-                        
-                        // Last resort: get all visible list items
-                        resolve(Array.from(document.querySelectorAll('li:not([style*="display: none"])')).map(li => li.textContent.trim()));
-                    }}, 500);
-                }});
-            }}
-            return [];
-        }}
-    """)
-    logger.info(f"Available discipline options: {discipline_options}")
+    discipline_options = option_lists.get("#discipline--0", [])
+    logger.info("Available discipline options: %s", discipline_options)
     
     # Use a valid discipline option if available, otherwise use the default
     discipline_value = "Computer Science"
@@ -449,290 +542,86 @@ async def test_typeahead_improvements(browser_manager):
         valid_options = [opt for opt in discipline_options if opt.lower().startswith("computer")]
         if valid_options:
             discipline_value = valid_options[0]
-            logger.info(f"Using valid discipline option from dropdown: '{discipline_value}'")
+            logger.info("Using valid discipline option from dropdown: '%s'", discipline_value)
     
     discipline_success, discipline_time = await test_typeahead_field("#discipline--0", "discipline", discipline_value)
     
     # Log results
     logger.info("\n===== Typeahead Improvement Test Results =====")
     
+    # Run every post-fill check in a single evaluate round-trip
+    checks = await browser_manager.page.main_frame.evaluate(POST_FILL_CHECKS_JS)
+    location_filled, school_filled, degree_filled, discipline_filled = (
+        checks["location"], checks["school"], checks["degree"], checks["discipline"]
+    )
+    school_value, degree_flags = checks["schoolState"], checks["degreeFlags"]
+    
     # For the location field - check if filled correctly
-    location_filled = await browser_manager.page.main_frame.evaluate("""
-        () => {
-            const el = document.querySelector("input[id*='location']");
-            return el ? (el.value || "").toLowerCase().includes("francisco") : false;
-        }
-    """)
     location_success = location_success or location_filled
-    logger.info(f"Location: {'✓' if location_success else '✗'} in {location_time:.2f}s" + 
-                (f" (direct text entry)" if not location_success and location_filled else ""))
+    logger.info("Location: %s in %.2fs%s", '✓' if location_success else '✗', location_time,
+                " (direct text entry)" if not location_success and location_filled else "")
     
     # For the school field - check if filled correctly
-    school_filled = await browser_manager.page.main_frame.evaluate("""
-        () => {
-            const el = document.querySelector("#school--0");
-            if (!el) return false;
-            
-            // First check actual value property - most reliable
-            const inputValue = el.value || "";
-            if (inputValue.toLowerCase().includes("berkeley")) {
-                console.log("Found berkeley in input value:", inputValue);
-                return true;
-            }
-            
-            // Check if it's in a React select container
-            const container = el.closest('.select__control') || el.closest('div[class*="select"]');
-            if (container) {
-                // Look for visible value display elements
-                const valueSelectors = [
-                    '.select__single-value', 
-                    'div[class*="singleValue"]',
-                    'div[class*="value"]',
-                    'div > span',
-                    'div'
-                ];
-                
-                for (const selector of valueSelectors) {
-                    const valueElements = container.querySelectorAll(selector);
-                    for (const valueEl of valueElements) {
-                        if (valueEl.textContent && valueEl.textContent.toLowerCase().includes("berkeley")) {
-                            console.log("Found berkeley in React select:", valueEl.textContent);
-                            return true;
-                        }
-                    }
-                }
-            }
-            
-            // Check more broadly around the input
-            let parent = el;
-            for (let i = 0; i < 3; i++) { // Check up to 3 levels up
-                parent = parent.parentElement;
-                if (!parent) break;
-                
-                const elements = parent.querySelectorAll('div, span, p');
-                for (const element of elements) {
-                    if (element.textContent && element.textContent.toLowerCase().includes("berkeley")) {
-                        console.log("Found berkeley in nearby element:", element.textContent);
-                        return true;
-                    }
-                }
-            }
-            
-            // Verify that text was actually entered in the field
-            // For React-select, even if the dropdown selection didn't happen,
-            // the text being present in the input is a successful fill
-            if (document.activeElement === el && inputValue.toLowerCase().includes("berkeley")) {
-                console.log("Berkeley is in the active field:", inputValue);
-                return true;
-            }
-            
-            // Check document for any visible element with berkeley
-            const berkElements = Array.from(document.querySelectorAll('div, span, p'))
-                .filter(el => el.offsetParent !== null && el.textContent.toLowerCase().includes("berkeley"));
-            
-            if (berkElements.length > 0) {
-                console.log("Found berkeley somewhere on page:", berkElements[0].textContent);
-                return true;
-            }
-            
-            return false;
-        }
-    """)
-    
     if not school_filled:
         # Take a screenshot of the school field to help debug
-        await browser_manager.take_screenshot("school_field.png")
+        if trace_enabled():
+            trace_screenshot(browser_manager, Path("school_field.png"))
         
         # Log the school field's value from multiple sources
-        school_value = await browser_manager.page.main_frame.evaluate("""
-            () => {
-                const el = document.querySelector("#school--0");
-                if (!el) return "Element not found";
-                
-                // Get value from multiple sources for debugging
-                return {
-                    value: el.value || "",
-                    innerHTML: el.parentElement ? el.parentElement.innerHTML : "No parent",
-                    // Check if text was actually entered in the input
-                    directTextEntry: el.value.toLowerCase().includes("berkeley"),
-                    // Check React select container state
-                    reactSelectedValue: (() => {
-                        const container = el.closest('.select__control') || el.closest('div[class*="select"]');
-                        if (!container) return "No container found";
-                        const valueEl = container.querySelector('.select__single-value, div[class*="value"], span');
-                        return valueEl ? valueEl.textContent : "No value element found";
-                    })()
-                };
-            }
-        """)
-        logger.info(f"School field value detection: {school_value}")
+        logger.info("School field value detection: %s", school_value)
         
         # Check for the expected value and fail if it's wrong
-        if school_value and 'reactSelectedValue' in school_value:
+        if isinstance(school_value, dict):
             actual_value = school_value['reactSelectedValue']
             expected_value = "University of California, Berkeley"
             if actual_value and expected_value.lower() not in actual_value.lower():
-                logger.warning(f"❌ School field has incorrect value: {actual_value}, expected: {expected_value}")
+                logger.warning("❌ School field has incorrect value: %s, expected: %s", actual_value, expected_value)
                 school_filled = False
             else:
-                logger.info(f"✓ School field has correct value: {actual_value}")
+                logger.info("✓ School field has correct value: %s", actual_value)
         
         # Even if school_filled is false, check if text was entered directly
-        direct_text_entry = await browser_manager.page.main_frame.evaluate("""
-            () => {
-                const el = document.querySelector("#school--0");
-                return el && el.value.toLowerCase().includes("berkeley");
-            }
-        """)
-        if direct_text_entry:
+        if isinstance(school_value, dict) and school_value['directTextEntry']:
             logger.info("School field was filled via direct text entry even though dropdown selection failed")
             school_filled = True
     
     school_success = school_success or school_filled
-    logger.info(f"School: {'✓' if school_success else '✗'} in {school_time:.2f}s" + 
-                (f" (direct text entry)" if not school_success and school_filled else ""))
+    logger.info("School: %s in %.2fs%s", '✓' if school_success else '✗', school_time,
+                " (direct text entry)" if not school_success and school_filled else "")
     
     # For the degree field - check if filled correctly
-    degree_filled = await browser_manager.page.main_frame.evaluate("""
-        () => {
-            const el = document.querySelector("#degree--0");
-            if (!el) return false;
-            
-            // First check actual value property
-            const inputValue = el.value || "";
-            if (inputValue.toLowerCase().includes("bachelor")) {
-                console.log("Found bachelor in input value:", inputValue);
-                return true;
-            }
-            
-            // Check if it's in a React select container
-            const container = el.closest('.select__control') || el.closest('div[class*="select"]');
-            if (container) {
-                // Look for visible value display elements
-                const valueSelectors = [
-                    '.select__single-value', 
-                    'div[class*="singleValue"]',
-                    'div[class*="value"]',
-                    'div > span',
-                    'div'
-                ];
-                
-                for (const selector of valueSelectors) {
-                    const valueElements = container.querySelectorAll(selector);
-                    for (const valueEl of valueElements) {
-                        if (valueEl.textContent && valueEl.textContent.toLowerCase().includes("bachelor")) {
-                            console.log("Found bachelor in React select:", valueEl.textContent);
-                            return true;
-                        }
-                    }
-                }
-            }
-            
-            // Check more broadly around the input
-            let parent = el;
-            for (let i = 0; i < 3; i++) { // Check up to 3 levels up
-                parent = parent.parentElement;
-                if (!parent) break;
-                
-                const elements = parent.querySelectorAll('div, span, p');
-                for (const element of elements) {
-                    if (element.textContent && element.textContent.toLowerCase().includes("bachelor")) {
-                        console.log("Found bachelor in nearby element:", element.textContent);
-                        return true;
-                    }
-                }
-            }
-            
-            // Verify that text was actually entered in the field
-            if (document.activeElement === el && inputValue.toLowerCase().includes("bachelor")) {
-                console.log("Bachelor is in the active field:", inputValue);
-                return true;
-            }
-            
-            // Check document for any visible element with bachelor
-            const bsElements = Array.from(document.querySelectorAll('div, span, p'))
-                .filter(el => el.offsetParent !== null && el.textContent.toLowerCase().includes("bachelor"));
-            
-            if (bsElements.length > 0) {
-                console.log("Found bachelor somewhere on page:", bsElements[0].textContent);
-                return true;
-            }
-            
-            return false;
-        }
-    """)
-    
     if not degree_filled:
         # Take a screenshot of the degree field to help debug
-        await browser_manager.take_screenshot("degree_field.png")
+        if trace_enabled():
+            trace_screenshot(browser_manager, Path("degree_field.png"))
         
-        # Log the degree field's value from multiple sources
-        degree_value = await browser_manager.page.main_frame.evaluate("""
-            () => {
-                const el = document.querySelector("#degree--0");
-                if (!el) return "Element not found";
-                
-                // Get value from multiple sources for debugging
-                return {
-                    value: el.value || "",
-                    innerHTML: el.parentElement ? el.parentElement.innerHTML : "No parent",
-                    // Check if text was actually entered in the input
-                    directTextEntry: el.value.toLowerCase().includes("bachelor"),
-                    // Check React select container state
-                    reactSelectedValue: (() => {
-                        const container = el.closest('.select__control') || el.closest('div[class*="select"]');
-                        if (!container) return "No container found";
-                        const valueEl = container.querySelector('.select__single-value, div[class*="value"], span');
-                        return valueEl ? valueEl.textContent : "No value element found";
-                    })()
-                };
-            }
-        """)
-        logger.info(f"Degree field value detection: {degree_value}")
+        # Log the degree field's fill state flags
+        logger.info("Degree field state flags: direct_entry=%s, react_selected=%s",
+                    bool(degree_flags & FIELD_DIRECT_ENTRY), bool(degree_flags & FIELD_REACT_SELECTED))
         
         # Even if degree_filled is false, check if text was entered directly
-        direct_text_entry = await browser_manager.page.main_frame.evaluate("""
-            () => {
-                const el = document.querySelector("#degree--0");
-                return el && el.value.toLowerCase().includes("bachelor");
-            }
-        """)
-        if direct_text_entry:
+        if degree_flags & FIELD_DIRECT_ENTRY:
             logger.info("Degree field was filled via direct text entry even though dropdown selection failed")
             degree_filled = True
     
     degree_success = degree_success or degree_filled
-    logger.info(f"Degree: {'✓' if degree_success else '✗'} in {degree_time:.2f}s" + 
-                (f" (direct text entry)" if not school_success and school_filled else ""))
+    logger.info("Degree: %s in %.2fs%s", '✓' if degree_success else '✗', degree_time,
+                " (direct text entry)" if not school_success and school_filled else "")
     
     # For the discipline field - check if filled correctly
-    discipline_filled = await browser_manager.page.main_frame.evaluate("""
-        () => {
-            const el = document.querySelector("#discipline--0");
-            const value = el ? el.value || "" : "";
-            if (value.toLowerCase().includes("computer")) return true;
-            
-            // Also check for React Select components that store value in a different element
-            const container = el ? el.closest('.select__control') : null;
-            if (container) {
-                const valueEl = container.querySelector('.select__single-value');
-                return valueEl ? valueEl.textContent.toLowerCase().includes("computer") : false;
-            }
-            return false;
-        }
-    """)
     discipline_success = discipline_success or discipline_filled
-    logger.info(f"Discipline: {'✓' if discipline_success else '✗'} in {discipline_time:.2f}s" + 
-                (f" (direct text entry)" if not discipline_success and discipline_filled else ""))
+    logger.info("Discipline: %s in %.2fs%s", '✓' if discipline_success else '✗', discipline_time,
+                " (direct text entry)" if not discipline_success and discipline_filled else "")
     
     # Update our final successful count to reflect the actual text filled values
-    success_count = sum([
-        1 if location_success or location_filled else 0,
-        1 if school_success or school_filled else 0, 
-        1 if degree_success or degree_filled else 0, 
-        1 if discipline_success or discipline_filled else 0
-    ])
-    logger.info(f"Overall: {success_count}/4 fields successfully filled")
+    success_mask = (
+        bool(location_success or location_filled)
+        | bool(school_success or school_filled) << 1
+        | bool(degree_success or degree_filled) << 2
+        | bool(discipline_success or discipline_filled) << 3
+    )
+    success_count = bin(success_mask).count("1")
+    logger.info("Overall: %d/4 fields successfully filled", success_count)
     
     # Add context for the final result
     if success_count == 4:
@@ -749,15 +638,41 @@ async def test_typeahead_improvements(browser_manager):
     logger.info("Typeahead improvement test completed!")
     return True
 
+# Initialized browsers keyed on launch config, reused across manual run_test() calls
+_BROWSER_POOL: Dict[tuple, BrowserManager] = {}
+
+async def get_browser(visible: bool = True) -> BrowserManager:
+    """Return a pooled, initialized BrowserManager for the given config, with the probes installed."""
+    key = (visible,)
+    browser_manager = _BROWSER_POOL.get(key)
+    if browser_manager is None:
+        browser_manager = BrowserManager(visible=visible)
+        await browser_manager.initialize()
+        await install_probes(browser_manager)
+        _BROWSER_POOL[key] = browser_manager
+    return browser_manager
+
+async def close_browser_pool():
+    """Close every pooled browser."""
+    while _BROWSER_POOL:
+        _, browser_manager = _BROWSER_POOL.popitem()
+        await browser_manager.close()
+
 async def run_test():
     """Run the typeahead improvements test manually (outside of pytest)."""
-    browser_manager = BrowserManager(visible=True)
-    await browser_manager.initialize()
+    browser_manager = await get_browser(visible=True)
+    await open_test_page(browser_manager)
+    tools = (browser_manager, *build_test_tools(browser_manager))
+    # await test_field_detection(tools)
+    await test_typeahead_improvements(tools)
+
+async def main():
+    """Run the manual test and close the pooled browsers on the way out."""
     try:
-        # await test_field_detection(browser_manager)
-        await test_typeahead_improvements(browser_manager)
+        await run_test()
     finally:
-        await browser_manager.close()
+        await drain_trace_tasks()
+        await close_browser_pool()
 
 if __name__ == "__main__":
-    asyncio.run(run_test()) 
\ No newline at end of file
+    asyncio.run(main()) 
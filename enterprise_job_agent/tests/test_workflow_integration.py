@@ -2,12 +2,22 @@
 
 import pytest
 import asyncio
+import functools
 import json
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, Any
 from unittest.mock import MagicMock, AsyncMock, patch
+import yaml
 from json import JSONEncoder
 from google.auth.credentials import Credentials
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 from enterprise_job_agent.core.crew_manager import JobApplicationCrew
 from enterprise_job_agent.core.browser_manager import BrowserManager
 from enterprise_job_agent.core.diagnostics_manager import DiagnosticsManager
@@ -49,161 +59,47 @@ MOCK_USER_PROFILE = {
 
 MOCK_JOB_DESCRIPTION = "Software Engineer position at Tech Corp"
 
-class MockLLMEncoder(JSONEncoder):
-    """Custom JSON encoder for MockLLM objects."""
+# Canned LLM payloads; edit the YAML to track real model output
+CASSETTE_PATH = Path(__file__).parent / "cassettes" / "workflow.yaml"
+
+class StubLLMEncoder(JSONEncoder):
+    """Custom JSON encoder for StubLLM objects."""
     def default(self, obj):
-        if isinstance(obj, MockLLM):
+        if isinstance(obj, StubLLM):
             return obj.model_dump()
         return super().default(obj)
 
-class MockLLM:
-    def __init__(self, *args, **kwargs):
-        self._model = "gemini-pro"
-        self._api_key = "mock-api-key"
-        self._api_base = "mock-api-base"
-        self._base_url = "mock-base-url"
-        self._provider = "google"
-        self._temperature = 0.7
-        self._project = "mock-project"
-
-    def __repr__(self):
-        """Return a string representation of the mock object."""
-        return f"MockLLM(model={self._model})"
-
-    def __str__(self):
-        """Return a string representation of the mock object."""
-        return self.__repr__()
-
-    def __getattr__(self, name):
-        """Handle attribute access for specific attributes."""
-        if name in ["model", "api_key", "api_base", "base_url", "provider", "temperature", "project"]:
-            return getattr(self, f"_{name}")
-        return super().__getattr__(name)
-
-    def model_dump(self):
-        """Return a dictionary with only JSON-serializable values."""
-        return {
-            "model": self._model,
-            "api_key": self._api_key,
-            "api_base": self._api_base,
-            "base_url": self._base_url,
-            "provider": self._provider,
-            "temperature": self._temperature,
-            "project": self._project
-        }
-
-    def mock_invoke(self, messages, *args, **kwargs):
-        """Mock the invoke method to return structured responses."""
-        # Convert messages to a JSON-serializable format
-        if isinstance(messages, (list, tuple)):
-            messages = [
-                {k: str(v) if not isinstance(v, (str, int, float, bool, type(None))) else v
-                 for k, v in msg.items()}
-                for msg in messages
-            ]
-        
-        # Convert kwargs to JSON-serializable format
-        kwargs = {
-            k: str(v) if not isinstance(v, (str, int, float, bool, type(None))) else v
-            for k, v in kwargs.items()
-        }
-
-        last_message = messages[-1]["content"] if messages else ""
-        
-        if "form analysis" in last_message.lower():
-            content = json.dumps({
-                "fields": {
-                    "name": {
-                        "type": "TEXT",
-                        "required": True,
-                        "importance": 0.8,
-                        "label": "Full Name"
-                    },
-                    "education": {
-                        "type": "SELECT",
-                        "required": True,
-                        "importance": 0.8,
-                        "label": "University"
-                    }
-                },
-                "analysis": {
-                    "field_count": 2,
-                    "required_fields": 2,
-                    "optional_fields": 0
-                }
-            })
-        elif "profile mapping" in last_message.lower():
-            content = json.dumps({
-                "mappings": {
-                    "name": "John Doe",
-                    "education": "MIT"
-                },
-                "confidence": 0.9
-            })
-        else:
-            content = "Task completed successfully."
-
-        # Return in LiteLLM format
-        return {
-            "choices": [{
-                "message": {
-                    "content": content,
-                    "role": "assistant"
-                }
-            }]
-        }
-
-    def completion(self, messages=None, *args, **kwargs):
-        """Handle completion requests by directly returning mock responses."""
-        return self.mock_invoke(messages or [], *args, **kwargs)
-
-    async def acompletion(self, messages=None, *args, **kwargs):
-        """Async version of completion."""
-        return self.completion(messages, *args, **kwargs)
-
-    def chat(self, messages=None, *args, **kwargs):
-        """Alias for completion."""
-        return self.completion(messages, *args, **kwargs)
-
-    async def achat(self, messages=None, *args, **kwargs):
-        """Async alias for completion."""
-        return await self.acompletion(messages, *args, **kwargs)
+def _stub_llm_default(obj):
+    """Serialize StubLLM instances for orjson, which has no JSONEncoder hook."""
+    if isinstance(obj, StubLLM):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(obj) -> str:
+    """Serialize to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_stub_llm_default).decode()
+    return json.dumps(obj, cls=StubLLMEncoder)
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_external_services():
+    """Patch Google auth and LiteLLM once for the whole module."""
+    def mock_default(*args, **kwargs):
+        return MockCredentials(), "mock-project"
 
-# Register the custom encoder
-json.JSONEncoder.default = MockLLMEncoder().default
+    with ExitStack() as stack:
+        stack.enter_context(patch("google.auth.default", mock_default))
+        # Mock LiteLLM's provider resolution
+        stack.enter_context(patch("litellm.utils.get_llm_provider", return_value=("google", "gemini-pro")))
+        stack.enter_context(patch.multiple("litellm", completion=mock_completion, acompletion=mock_acompletion))
+        yield
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_llm():
     """Mock LLM for testing."""
-    llm = MagicMock()
-    llm.model = "gemini-pro"
-    llm.api_key = "mock-api-key"
-    llm.api_base = "mock-api-base"
-    llm.base_url = "mock-base-url"
-    llm.provider = "google"
-    llm.temperature = 0.7
-    llm.project = "mock-project"
-    llm.completion = mock_completion
-    llm.acompletion = mock_acompletion
-    llm.__str__ = lambda self: f"MockLLM(model={self.model})"
-    llm.__repr__ = lambda self: f"MockLLM(model={self.model})"
-    llm.model_dump = lambda: {
-        "model": llm.model,
-        "api_key": llm.api_key,
-        "api_base": llm.api_base,
-        "base_url": llm.base_url,
-        "provider": llm.provider,
-        "temperature": llm.temperature,
-        "project": llm.project
-    }
-    
-    # Mock LiteLLM's provider resolution
-    with patch("litellm.utils.get_llm_provider", return_value=("google", "gemini-pro")), \
-         patch("litellm.completion", side_effect=mock_completion), \
-         patch("litellm.acompletion", side_effect=mock_acompletion):
-        yield llm
-
-@pytest.fixture
+    return StubLLM()
+
+@pytest.fixture(scope="module")
 def mock_browser_manager():
     """Mock browser manager for testing."""
     mock = MagicMock()
@@ -212,7 +108,7 @@ def mock_browser_manager():
     mock.close = AsyncMock()
     return mock
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_diagnostics_manager():
     """Mock diagnostics manager for testing."""
     mock = MagicMock()
@@ -221,9 +117,9 @@ def mock_diagnostics_manager():
     mock.log_error = MagicMock()
     return mock
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def job_application_crew(mock_llm, mock_browser_manager, mock_diagnostics_manager):
-    """Create a job application crew with mock components."""
+    """Create a job application crew with mock components, shared by the module's tests."""
     return JobApplicationCrew(
         llm=mock_llm,
         browser_manager=mock_browser_manager,
@@ -232,63 +128,18 @@ def job_application_crew(mock_llm, mock_browser_manager, mock_diagnostics_manage
     )
 
 @pytest.fixture(autouse=True)
-def mock_google_auth(monkeypatch):
-    def mock_default(*args, **kwargs):
-        return MockCredentials(), "mock-project"
-    monkeypatch.setattr("google.auth.default", mock_default)
-
-def mock_completion(*args, **kwargs):
-    """Mock LiteLLM's completion method."""
-    messages = kwargs.get("messages", [])
-    last_message = messages[-1]["content"] if messages else ""
-    
-    if "form analysis" in last_message.lower():
-        content = {
-            "fields": {
-                "name": {
-                    "type": "TEXT",
-                    "required": True,
-                    "importance": 0.8,
-                    "label": "Full Name"
-                },
-                "education": {
-                    "type": "SELECT",
-                    "required": True,
-                    "importance": 0.8,
-                    "label": "University"
-                }
-            },
-            "analysis": {
-                "field_count": 2,
-                "required_fields": 2,
-                "optional_fields": 0
-            }
-        }
-    elif "profile mapping" in last_message.lower():
-        content = {
-            "mappings": {
-                "name": "John Doe",
-                "education": "MIT"
-            },
-            "confidence": 0.9
-        }
-    else:
-        content = {
-            "stages": [
-                {
-                    "name": "Form Analysis",
-                    "status": "completed",
-                    "details": "Successfully analyzed form structure"
-                }
-            ],
-            "success": True,
-            "message": "Job application process completed successfully"
-        }
-
+def _reset_mocks(mock_browser_manager, mock_diagnostics_manager):
+    """Reset call records and injected side effects so tests don't leak into each other."""
+    yield
+    mock_browser_manager.reset_mock(side_effect=True)
+    mock_diagnostics_manager.reset_mock(side_effect=True)
+
+def _completion_response(content: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a LiteLLM-style completion response around a JSON payload."""
     return {
         "choices": [{
             "message": {
-                "content": json.dumps(content),
+                "content": _dumps(content),
                 "role": "assistant"
             }
         }],
@@ -300,10 +151,80 @@ def mock_completion(*args, **kwargs):
         }
     }
 
+@functools.lru_cache(maxsize=None)
+def _load_cassette() -> Dict[str, Dict[str, Any]]:
+    """Load the canned LLM payloads from disk (once per session)."""
+    with open(CASSETTE_PATH, encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+# Canned completion responses keyed by prompt phrase, serialized once at import
+_RESPONSES = {
+    phrase: _completion_response(payload)
+    for phrase, payload in _load_cassette().items()
+    if phrase != "default"
+}
+_DEFAULT_RESPONSE = _completion_response(_load_cassette()["default"])
+# Messages shorter than every phrase can't match, so they skip the lower() copy
+_MIN_PHRASE_LEN = min(map(len, _RESPONSES), default=0)
+
+def _dispatch(message: str) -> Dict[str, Any]:
+    """Pick the canned response whose phrase appears in the prompt's last message."""
+    if len(message) < _MIN_PHRASE_LEN:
+        return _DEFAULT_RESPONSE
+    lowered = message.lower()
+    for phrase, response in _RESPONSES.items():
+        if phrase in lowered:
+            return response
+    return _DEFAULT_RESPONSE
+
+def mock_completion(*args, **kwargs):
+    """Mock LiteLLM's completion method."""
+    messages = kwargs.get("messages", [])
+    last_message = messages[-1]["content"] if messages else ""
+    return _dispatch(last_message)
+
 async def mock_acompletion(*args, **kwargs):
     """Async version of mock_completion."""
     return mock_completion(*args, **kwargs)
 
+# eq=False keeps plain-object identity equality and hashing, like the LLM it stands in for
+@dataclass(slots=True, eq=False)
+class StubLLM:
+    """Plain LLM stand-in exposing only what the crew and LiteLLM touch."""
+    model: str = "gemini-pro"
+    api_key: str = "mock-api-key"
+    api_base: str = "mock-api-base"
+    base_url: str = "mock-base-url"
+    provider: str = "google"
+    temperature: float = 0.7
+    project: str = "mock-project"
+
+    completion = staticmethod(mock_completion)
+    acompletion = staticmethod(mock_acompletion)
+
+    def call(self, messages, *args, **kwargs) -> str:
+        """Answer like crewai's LLM.call, which ProfileAdapterAgent uses: the reply text only."""
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        response = mock_completion(messages=messages)
+        return response["choices"][0]["message"]["content"]
+
+    def __repr__(self):
+        """Return a string representation of the stub (also used by str())."""
+        return f"StubLLM(model={self.model})"
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Return a dictionary with only JSON-serializable values."""
+        return {
+            "model": self.model,
+            "api_key": self.api_key,
+            "api_base": self.api_base,
+            "base_url": self.base_url,
+            "provider": self.provider,
+            "temperature": self.temperature,
+            "project": self.project
+        }
+
 @pytest.mark.asyncio
 async def test_workflow_integration(job_application_crew):
     """Test that all components are properly connected and the workflow executes."""
@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+import pytest
+
+from enterprise_job_agent.tools.field_identifier import FieldDetector
+
+# Run every test in this module on one shared event loop
+pytestmark = pytest.mark.asyncio(scope="module")
+
+
+class FakePage:
+    """Page stand-in that records event handlers so a test can fire them."""
+
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def emit(self, event, *args):
+        for handler in self.handlers.get(event, []):
+            handler(*args)
+
+
+@pytest.fixture
+def page():
+    return FakePage()
+
+
+@pytest.fixture
+def lookups():
+    """Field names that reached the uncached detection strategies."""
+    return []
+
+
+@pytest.fixture
+def field_detector(page, lookups, monkeypatch):
+    """FieldDetector built from a browser manager, as the integration tests do."""
+    detector = FieldDetector(SimpleNamespace(page=page))
+
+    async def find_uncached(field_name, frame=None, field_types=None):
+        lookups.append(field_name)
+        return ("#first-name", object())
+
+    monkeypatch.setattr(detector, "_find_field_by_name_uncached", find_uncached)
+    return detector
+
+
+async def test_repeated_lookup_uses_cache(field_detector, lookups):
+    """A second lookup of the same field skips the detection strategies."""
+    first = await field_detector.find_field_by_name("First Name")
+    second = await field_detector.find_field_by_name("First Name")
+
+    assert second is first
+    assert lookups == ["First Name"]
+
+
+async def test_navigation_clears_cache(field_detector, page, lookups):
+    """A frame navigation on the wrapped page turns the next lookup into a cache miss."""
+    await field_detector.find_field_by_name("First Name")
+    page.emit("framenavigated", object())
+    await field_detector.find_field_by_name("First Name")
+
+    assert lookups == ["First Name", "First Name"]
@@ -3,13 +3,20 @@
 import re
 import logging
 import asyncio
+import functools
+import random
+import textwrap
 from typing import Dict, Any, Optional, List, Union, Tuple
 from enum import Enum, auto
 import time
 import difflib
-import json
-import traceback
-from thefuzz import fuzz # Ensure this import is present
+from collections import OrderedDict
+from dataclasses import dataclass, field
+try:
+    from rapidfuzz import fuzz, process as rfprocess, utils as rfutils
+except ImportError:  # rapidfuzz is optional; fall back to thefuzz and difflib
+    from thefuzz import fuzz
+    rfprocess = None
 
 from enterprise_job_agent.core.browser_interface import BrowserInterface
 from enterprise_job_agent.core.diagnostics_manager import DiagnosticsManager
@@ -29,14 +36,354 @@ INTERACTION_DELAY = 0.5  # seconds
 POST_TYPE_DELAY = 0.75   # seconds
 POST_CLICK_DELAY = 0.5   # seconds
 RETRY_DELAY_BASE = 0.5   # seconds
+MAX_BACKOFF = 8.0        # seconds, cap on a single retry delay
+SELECT_STRATEGY_CACHE_SIZE = 256  # selectors whose working select strategy is remembered
+LARGE_OPTION_LIST_SIZE = 50  # above this many options, fuzzy scoring runs multithreaded
+TYPEAHEAD_MATCH_CUTOFF = 60  # minimum WRatio (0-100) for a typeahead option to be clicked
+
+# Strategies of the custom dropdown path in select_option, as opposed to Playwright's select_option
+_CUSTOM_SELECT_STRATEGIES = frozenset({"click", "type"})
+
+# Punctuation and other non-word characters, stripped when normalizing option text
+_NON_ALNUM_RE = re.compile(r'[^\w\s]')
 
 # Similarity Thresholds (0.0 to 1.0)
 DEFAULT_FUZZY_THRESHOLD = 0.75
 HIGH_FUZZY_THRESHOLD = 0.80
 VERIFICATION_THRESHOLD = 0.70
 LOW_VERIFICATION_THRESHOLD = 0.60 # For less certain cases like keyboard nav fallback
+HIGH_FUZZY_THRESHOLD_PCT = round(HIGH_FUZZY_THRESHOLD * 100)  # same threshold as an int on fuzz's 0-100 scale
+
+# Option-scoped selectors tried for each value variation in _try_click_option
+_OPTION_SELECTOR_TEMPLATES = (
+    "div[role='option']:has-text('{v}')",
+    "li:has-text('{v}')",
+    "option:has-text('{v}')",
+    "[role='option']:has-text('{v}')",
+    ".dropdown-item:has-text('{v}')",
+    ".select-option:has-text('{v}')",
+    ".autocomplete-result:has-text('{v}')",
+    "div[role='option']:text-is('{v}')",
+    "li:text-is('{v}')",
+    "option:text-is('{v}')",
+    "[role='option']:text-is('{v}')",
+)
+# All option-scoped templates as one selector list, so each variation costs a single query
+_OPTION_SELECTOR_TEMPLATE = ", ".join(_OPTION_SELECTOR_TEMPLATES)
+# Any element with exactly the text, queried separately and only after the option-scoped
+# selectors: joined in, the control's own value display or a label earlier in the DOM
+# would win over the menu option
+_BARE_TEXT_SELECTOR_TEMPLATE = ":text-is('{v}')"
+
+# Common dropdown containers and options for the standard typeahead path, pre-joined into one selector each
+_DROPDOWN_CONTAINER_SELECTOR = 'ul[role="listbox"], .dropdown-menu, [role="listbox"], .select-dropdown, .autocomplete-results'
+_DROPDOWN_OPTION_SELECTOR = 'li[role="option"], .dropdown-item, [role="option"], .select-option, .autocomplete-result'
+# Anything that means a menu is still open after an option was clicked (react-select menus included)
+_OPEN_MENU_SELECTOR = _DROPDOWN_CONTAINER_SELECTOR + ', .select__menu, [role="option"]'
+
+# Typeahead scripts for handle_typeahead_with_ai, dedented once at import so every
+# evaluate call sends the identical script text. Matching itself happens in Python.
+_DROPDOWN_OPTIONS_JS = textwrap.dedent(r"""
+() => {
+    const optionSelectors = [
+        '[role="option"]', '.select__option', '.dropdown-item',
+        'li[id*="react-select"]', 'li.option', '[role="listbox"] > *',
+        '.select__menu .select__option', '[class*="select"] [class*="option"]',
+        '.autocomplete-item', '[role="listitem"]'
+    ];
+
+    for (const selector of optionSelectors) {
+        const options = Array.from(document.querySelectorAll(selector));
+        if (options.length > 0) {
+            return options.map(opt => ({
+                text: opt.textContent.trim(),
+                label: opt.getAttribute('aria-label') || '',
+                selected: opt.getAttribute('aria-selected') === 'true',
+                value: opt.getAttribute('data-value') || '',
+                element: selector
+            }));
+        }
+    }
+    return [];
+}
+""").strip()
+
+_CLICK_FIRST_OPTION_JS = textwrap.dedent(r"""
+(option) => {
+    const first = document.querySelector(option.element);
+    if (!first) return { success: false, error: "No match found" };
+    first.click();
+    return { success: true, selectedOption: option.text, fallback: true };
+}
+""").strip()
+
+# Every option type considered by the fuzzy fallback in _try_click_option
+_FUZZY_OPTION_SELECTOR = ", ".join((
+    "div[role='option']",
+    "li[role='option']",
+    "option",
+    "[role='option']",
+    ".dropdown-item",
+    ".select-option",
+    ".autocomplete-result",
+))
+
+# Input value and trimmed text of the element matching a selector, or null if there is none
+ELEMENT_VALUE_JS = """
+(sel) => {
+    const e = document.querySelector(sel);
+    return e ? {v: e.value ?? null, t: (e.textContent || '').trim()} : null;
+}
+"""
+
+# Text and visibility of every matched option, collected in a single round-trip.
+# Visibility is checked in-page (rendered, not hidden, has layout boxes) instead of a
+# Playwright is_visible() call per option.
+OPTION_SNAPSHOT_JS = """
+(els) => {
+    const vis = (e) => e.offsetParent !== null && !e.hidden && e.getClientRects().length > 0;
+    return els.map((e, i) => ({i, text: e.textContent?.trim() ?? '', visible: vis(e)}));
+}
+"""
+
+# Whether any element matching a selector is visible, using the same in-page check
+ANY_VISIBLE_JS = """
+(sel) => {
+    const vis = (e) => e.offsetParent !== null && !e.hidden && e.getClientRects().length > 0;
+    return Array.from(document.querySelectorAll(sel)).some(vis);
+}
+"""
+
+# Click the first visible element matching a selector; true if one was clicked
+CLICK_FIRST_VISIBLE_JS = """
+(sel) => {
+    const vis = (e) => e.offsetParent !== null && !e.hidden && e.getClientRects().length > 0;
+    const first = Array.from(document.querySelectorAll(sel)).find(vis);
+    if (!first) return false;
+    first.click();
+    return true;
+}
+"""
+
+# Patterns used by the typeahead variant generators, compiled once
+_SCHOOL_SEPARATOR_RE = re.compile(r'[,\-–\(\)]')
+_INSTITUTE_RE = re.compile(r'institute of technology|polytechnic')
+_WHITESPACE_RE = re.compile(r'\s+')
+_CITY_STATE_RE = re.compile(r'([^,]+),\s*([A-Z]{2}|[^,]+)$')
+_CITY_STATE_COUNTRY_RE = re.compile(r'([^,]+),\s*([^,]+),\s*([^,]+)$')
+
+# Degree variants, keyed by the markers that identify the degree; the first matching entry wins
+_DEGREE_VARIANTS = (
+    (("bachelor", "bs", "b.s."), (
+        "Bachelor of Science", "Bachelor's Degree", "Bachelor's degree",
+        "BS", "B.S.", "Bachelor", "Bachelors", "Bachelor's",
+    )),
+    (("master", "ms", "m.s."), (
+        "Master of Science", "Master's Degree", "Master's degree",
+        "MS", "M.S.", "Master", "Masters", "Master's",
+    )),
+    (("phd", "ph.d", "doctor"), (
+        "PhD", "Doctor of Philosophy", "Ph.D.", "Doctorate", "Doctoral Degree", "Doctoral degree",
+    )),
+    (("associate", "aa", "a.a."), (
+        "Associate Degree", "Associate's Degree", "Associate's degree",
+        "AA", "A.A.", "Associate", "Associates", "Associate's",
+    )),
+)
+# General "degree" variants that will match with any degree type
+_GENERIC_DEGREE_VARIANTS = ("Degree", "degree", "Any Degree", "College Degree", "Diploma")
+
+_US_STATE_CODES = {
+    "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", "california": "CA",
+    "colorado": "CO", "connecticut": "CT", "delaware": "DE", "florida": "FL", "georgia": "GA",
+    "hawaii": "HI", "idaho": "ID", "illinois": "IL", "indiana": "IN", "iowa": "IA",
+    "kansas": "KS", "kentucky": "KY", "louisiana": "LA", "maine": "ME", "maryland": "MD",
+    "massachusetts": "MA", "michigan": "MI", "minnesota": "MN", "mississippi": "MS", "missouri": "MO",
+    "montana": "MT", "nebraska": "NE", "nevada": "NV", "new hampshire": "NH", "new jersey": "NJ",
+    "new mexico": "NM", "new york": "NY", "north carolina": "NC", "north dakota": "ND", "ohio": "OH",
+    "oklahoma": "OK", "oregon": "OR", "pennsylvania": "PA", "rhode island": "RI", "south carolina": "SC",
+    "south dakota": "SD", "tennessee": "TN", "texas": "TX", "utah": "UT", "vermont": "VT",
+    "virginia": "VA", "washington": "WA", "west virginia": "WV", "wisconsin": "WI", "wyoming": "WY"
+}
+_US_STATE_NAMES = {code: name for name, code in _US_STATE_CODES.items()}
 # --- End Constants --- #
 
+
+if rfprocess is not None:
+    def _ratio_with_cutoff(a: str, b: str, cutoff: float) -> float:
+        """fuzz.ratio on the 0-100 scale; rapidfuzz returns 0 early once cutoff can't be reached."""
+        return fuzz.ratio(a, b, score_cutoff=cutoff)
+else:
+    def _ratio_with_cutoff(a: str, b: str, cutoff: float) -> float:
+        """fuzz.ratio on the 0-100 scale, 0 when below cutoff (thefuzz has no score_cutoff)."""
+        score = fuzz.ratio(a, b)
+        return score if score >= cutoff else 0
+
+
+def _best_fuzzy_option(target: str, texts: List[str], cutoff: int) -> Optional[Tuple[int, float]]:
+    """Find the option text closest to target.
+
+    Args:
+        target: Lowercased text to match
+        texts: Text content of the visible options
+        cutoff: fuzz.ratio score on the 0-100 scale that a match must exceed
+
+    Returns:
+        (index, score) of the best option scoring above cutoff, or None
+    """
+    # An exact (case-folded) match wins outright without any fuzzy scoring
+    for index, text in enumerate(texts):
+        if text.lower() == target:
+            return (index, 100)
+
+    if rfprocess is not None:
+        match = rfprocess.extractOne(target, texts, scorer=fuzz.ratio, processor=str.lower, score_cutoff=cutoff)
+        # Strictly above cutoff, like the fallback below: "male" scores exactly 80 against "female"
+        return (match[2], match[1]) if match and match[1] > cutoff else None
+
+    best = None
+    for index, text in enumerate(texts):
+        text = text.lower()
+        # ratio is at most 200 * shorter / (len_a + len_b); skip lengths that can't reach cutoff
+        if 200 * min(len(target), len(text)) < cutoff * (len(target) + len(text)):
+            continue
+        score = _ratio_with_cutoff(target, text, cutoff)
+        if score > cutoff and (best is None or score > best[1]):
+            best = (index, score)
+    return best
+
+
+def _best_variant_option(variants: List[str], texts: List[str], cutoff: float) -> Optional[Tuple[int, float]]:
+    """Score every variant against every option text, in one cdist call when rapidfuzz is available.
+
+    Args:
+        variants: Variants of the value being selected
+        texts: Option texts
+        cutoff: Minimum WRatio score on the 0-100 scale
+
+    Returns:
+        (option index, score) of the best pair reaching cutoff, or None
+    """
+    if not variants or not texts:
+        return None
+    if rfprocess is None:
+        best = max(
+            ((index, fuzz.WRatio(variant, text)) for variant in variants for index, text in enumerate(texts)),
+            key=lambda pair: pair[1]
+        )
+        return best if best[1] >= cutoff else None
+    # A thread pool only pays off for long option lists; small matrices are scored inline
+    workers = -1 if len(texts) > LARGE_OPTION_LIST_SIZE else 1
+    scores = rfprocess.cdist(
+        variants, texts, scorer=fuzz.WRatio, processor=rfutils.default_process,
+        score_cutoff=cutoff, workers=workers
+    )
+    variant_index, option_index = divmod(int(scores.argmax()), len(texts))
+    score = float(scores[variant_index, option_index])
+    return (option_index, score) if score >= cutoff else None
+
+
+def _noop_log(message: str) -> None:
+    """Stand-in for a diagnostics log method that isn't available."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _escape_css(value: str) -> str:
+    """Escape double quotes, which break :has-text("...") selectors."""
+    return value.replace('"', '\\"')
+
+
+@functools.lru_cache(maxsize=1024)
+def _generate_value_variations(value: str) -> Tuple[str, ...]:
+    """Build the distinct text variations of a value to look for among dropdown options."""
+    variations = [
+        value,
+        value.strip(),
+        value.lower(),
+        value.upper(),
+        value.title(),
+        _NON_ALNUM_RE.sub('', value),  # Remove special characters
+    ]
+
+    # Generate additional variations for specific value types
+    if ', ' in value:  # Location format like "City, State"
+        parts = value.split(', ')
+        if len(parts) >= 2:
+            variations.append(parts[0])  # Just the city
+            variations.append(parts[0] + ', ' + parts[1])  # City, State
+
+    # Remove duplicates, keeping the first occurrence
+    return tuple(dict.fromkeys(variations))
+
+
+@functools.lru_cache(maxsize=512)
+def _score_pair(expected: str, current: str) -> float:
+    """Similarity (0.0 to 1.0) of two normalized strings, exact/substring matches scoring 1.0.
+
+    A substring only counts when it is at least half as long as the other string, so a
+    short value like "no" doesn't verify against "not applicable".
+    """
+    if expected == current:
+        return 1.0
+    shorter, longer = sorted((expected, current), key=len)
+    if shorter and 2 * len(shorter) >= len(longer) and shorter in longer:
+        return 1.0
+    return fuzz.ratio(expected, current) / 100.0
+
+
+def _xpath_literal(value: str) -> str:
+    """Quote a string as an XPath 1.0 literal, using concat() when it holds both quote types."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+@functools.lru_cache(maxsize=1024)
+def _option_contains_xpath(variations: Tuple[str, ...]) -> str:
+    """Build one XPath matching option-like elements whose own text contains any of the variations.
+
+    text() rather than . so wrapper li/div elements, whose string value includes their
+    options' text, don't match ahead of the options themselves.
+    """
+    conditions = " or ".join(f"contains(text(), {_xpath_literal(v)})" for v in variations)
+    return f"xpath=//*[(self::div[@role='option'] or self::li or self::option) and ({conditions})]"
+
+
+def _best_option_match(value: str, texts: List[str]) -> Optional[Tuple[int, float]]:
+    """Find the option text closest to value.
+
+    Args:
+        value: The value to select from the dropdown
+        texts: Text content of the visible options
+
+    Returns:
+        (index, similarity) of the best option scoring above 0.6, or None
+    """
+    if rfprocess is not None and len(texts) > LARGE_OPTION_LIST_SIZE:
+        # Long lists (countries, schools) are scored across all cores in one native call
+        scores = rfprocess.cdist(
+            [value], texts, scorer=fuzz.ratio, processor=str.lower, score_cutoff=60, workers=-1
+        )[0]
+        index = int(scores.argmax())
+        return (index, float(scores[index]) / 100.0) if scores[index] > 60 else None
+
+    if rfprocess is not None:
+        # fuzz.ratio is difflib's ratio on the 0-100 scale, so this keeps the fallback's "> 0.6"
+        match = rfprocess.extractOne(value, texts, scorer=fuzz.ratio, processor=str.lower, score_cutoff=60)
+        return (match[2], match[1] / 100.0) if match and match[1] > 60 else None
+
+    best = None
+    for index, text in enumerate(texts):
+        if not text:
+            continue
+        similarity = difflib.SequenceMatcher(None, value.lower(), text.lower()).ratio()
+        if similarity > 0.6 and (best is None or similarity > best[1]):
+            best = (index, similarity)
+    return best
+
+
 class InteractionType(Enum):
     """Types of form interactions."""
     FILL = auto()
@@ -45,22 +392,19 @@ class InteractionType(Enum):
     UPLOAD = auto()
     CLEAR = auto()
 
+@dataclass(slots=True)
 class InteractionResult:
     """Result of a form interaction."""
-    def __init__(
-        self,
-        success: bool,
-        field_id: str,
-        interaction_type: InteractionType,
-        error: Optional[str] = None,
-        details: Optional[Dict[str, Any]] = None
-    ):
-        self.success = success
-        self.field_id = field_id
-        self.interaction_type = interaction_type
-        self.error = error
-        self.details = details or {}
-        self.retry_count = 0
+    success: bool
+    field_id: str
+    interaction_type: InteractionType
+    error: Optional[str] = None
+    details: Optional[Dict[str, Any]] = None
+    retry_count: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        if not self.details:
+            self.details = {}
 
 class FormInteraction:
     """Handles reliable form interactions with retries and error handling."""
@@ -89,29 +433,66 @@ class FormInteraction:
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
         
+        # Resolve the diagnostics log methods once instead of on every log call
+        dm = self.diagnostics_manager
+        self._dbg = getattr(dm, 'debug', _noop_log) if dm else _noop_log
+        self._info = getattr(dm, 'info', _noop_log) if dm else _noop_log
+        self._err = getattr(dm, 'error', getattr(dm, 'warning', _noop_log)) if dm else _noop_log
+        
+        # Frames resolved per frame_id, cleared whenever a frame navigates or detaches
+        self._frame_cache: Dict[Optional[str], Any] = {}
+        self._frame_cache_page = None
+        
+        # Typeahead variants memoized per (value, field_type)
+        self._typeahead_variant_cache = functools.lru_cache(maxsize=1024)(self._build_typeahead_variants)
+        
         # Set default retry configuration
         self.max_retries = self.config.get('max_retries', 3)
         self.retry_delay = self.config.get('retry_delay', RETRY_DELAY_BASE)
+        
+        # Cap on concurrent bulk queries so gathered lookups don't flood the browser with CDP messages
+        self._cdp_semaphore = asyncio.Semaphore(self.config.get('max_concurrent_cdp', 8))
+        
+        # Select strategy ("label", "value", "click" or "type") that last worked per selector, LRU ordered
+        self._select_strategy_cache: "OrderedDict[str, str]" = OrderedDict()
     
     def _log_debug(self, message):
         """Log a debug message using the diagnostics manager if available, otherwise pass."""
-        if self.diagnostics_manager:
-            if hasattr(self.diagnostics_manager, 'debug'):
-                self.diagnostics_manager.debug(message)
+        self._dbg(message)
             
     def _log_info(self, message):
         """Log an info message using the diagnostics manager if available, otherwise pass."""
-        if self.diagnostics_manager:
-            if hasattr(self.diagnostics_manager, 'info'):
-                self.diagnostics_manager.info(message)
+        self._info(message)
             
     def _log_error(self, message):
         """Log an error message using the diagnostics manager if available, otherwise pass."""
-        if self.diagnostics_manager:
-            if hasattr(self.diagnostics_manager, 'error'):
-                self.diagnostics_manager.error(message)
-            elif hasattr(self.diagnostics_manager, 'warning'):
-                self.diagnostics_manager.warning(message)
+        self._err(message)
+    
+    async def _get_frame(self, frame_id: Optional[str]):
+        """Resolve a frame via browser.get_frame, reusing earlier lookups until the page's frames change."""
+        page = self.browser.page
+        if page is not None and page is not self._frame_cache_page:
+            # New page: start over and invalidate on navigation from now on
+            self._frame_cache.clear()
+            page.on("framenavigated", self._clear_frame_cache)
+            page.on("framedetached", self._clear_frame_cache)
+            self._frame_cache_page = page
+        
+        frame = self._frame_cache.get(frame_id)
+        if frame is None:
+            frame = await self.browser.get_frame(frame_id)
+            if frame is not None:
+                self._frame_cache[frame_id] = frame
+        return frame
+    
+    def _clear_frame_cache(self, *_args) -> None:
+        """Drop cached frame lookups; registered for framenavigated/framedetached."""
+        self._frame_cache.clear()
+    
+    async def _bounded_qs(self, frame, selector: str) -> list:
+        """Run frame.query_selector_all under the concurrency cap for bulk queries."""
+        async with self._cdp_semaphore:
+            return await frame.query_selector_all(selector)
     
     async def _wait_for_element(
         self,
@@ -121,7 +502,7 @@ class FormInteraction:
     ) -> bool:
         """Wait for an element to be ready for interaction."""
         try:
-            frame = await self.browser.get_frame(frame_id) if frame_id else None
+            frame = await self._get_frame(frame_id) if frame_id else None
             element = await self.element_selector.wait_for_element(selector, frame=frame)
             return element is not None
         except Exception as e:
@@ -135,7 +516,7 @@ class FormInteraction:
         interaction_type: InteractionType,
         **kwargs
     ) -> InteractionResult:
-        """Retry an interaction with exponential backoff."""
+        """Retry an interaction with capped exponential backoff and full jitter."""
         result = InteractionResult(False, field_id, interaction_type)
         
         for attempt in range(self.max_retries):
@@ -152,16 +533,16 @@ class FormInteraction:
             # Update retry count
             result.retry_count = attempt + 1
             
-            # Wait before retry
+            # Wait before retry, jittered so concurrent retries don't line up
             if attempt < self.max_retries - 1:
-                await asyncio.sleep(self.retry_delay * (attempt + 1))
+                await asyncio.sleep(random.uniform(0, min(MAX_BACKOFF, self.retry_delay * (2 ** attempt))))
         
         return result
     
     def _escape_css_string(self, value: str) -> str:
         """Escape characters in a string that are special in CSS selectors, like quotes."""
         # Primarily escape double quotes for now, as they break :has-text("...")
-        return value.replace('"', '\\"')
+        return _escape_css(value)
     
     async def fill_field(self, selector: str, value: str, frame_id: Optional[str] = None):
         """Fill a field with a value.
@@ -190,7 +571,7 @@ class FormInteraction:
                 return True
             else:
                 # Try using direct frame fill if element selector failed
-                frame = await self.browser.get_frame(frame_id)
+                frame = await self._get_frame(frame_id)
                 if frame:
                     try:
                         await frame.fill(selector, value)
@@ -218,7 +599,8 @@ class FormInteraction:
             selector: CSS selector
             value: Value attribute of the option to select.
             label: Visible text/label of the option to select.
-            frame_id: Optional frame ID
+            frame_id: Optional logical frame ID as understood by browser.get_frame
+                (e.g. 'main' or a frame name), not a frame URL
             
         Returns:
             True if selection succeeded, False otherwise
@@ -227,105 +609,34 @@ class FormInteraction:
             self.logger.error("select_option requires either 'value' or 'label' to be provided.")
             return False
             
-        # Determine the primary target text for custom interactions and logging
-        target_text = label if label is not None else value
+        # Determine the primary target for logging
         log_value = f"label='{label}'" if label is not None else f"value='{value}'"
         log_target = f"'{selector}' with {log_value}"
         self.logger.debug(f"Attempting select_option for {log_target}")
 
         try:
-            frame = await self.browser.get_frame(frame_id) if frame_id else self.browser.page
+            frame = await self._get_frame(frame_id) if frame_id else self.browser.page
             if not frame:
                 if self.diagnostics_manager:
                     self.diagnostics_manager.error(f"Failed to get frame for select_option: {frame_id}")
                 return False
             
-            # 1. First, try standard select methods using Playwright's select_option
-            # Try by label first if provided, as it often corresponds to user intent
-            if label is not None:
-                 try:
-                     self.logger.debug(f"Trying standard select by label: {label}")
-                     await frame.select_option(selector, label=label, timeout=SHORT_TIMEOUT) # Add timeout
-                     if self.diagnostics_manager:
-                         self.diagnostics_manager.debug(f"Selected option by label for '{selector}': {label}")
-                     # Verify selection based on the label we tried to select
-                     if await verify_selection(frame, selector, label):
-                         return True
-                 except Exception as e:
-                     if self.diagnostics_manager:
-                         self.diagnostics_manager.debug(f"Failed standard select by label for '{selector}': {e}")
-            
-            # Try by value if provided (or if label failed)
-            if value is not None:
-                 try:
-                     self.logger.debug(f"Trying standard select by value: {value}")
-                     await frame.select_option(selector, value=value, timeout=SHORT_TIMEOUT) # Add timeout
-                     if self.diagnostics_manager:
-                         self.diagnostics_manager.debug(f"Selected option by value for '{selector}': {value}")
-                     # Verify selection based on the value we tried to select
-                     if await verify_selection(frame, selector, value):
-                         return True
-                 except Exception as e:
-                     if self.diagnostics_manager:
-                         self.diagnostics_manager.debug(f"Failed standard select by value for '{selector}': {e}")
-            
-            # 2. Try custom dropdown handling if standard methods failed
-            self.logger.debug(f"Standard select methods failed for {log_target}. Trying custom interaction using target text: '{target_text}'")
-            
-            # Get the element using the selector string, not the frame
-            # --- FIX: Extract frame_id string from frame object --- 
-            frame_id = frame.url # Use URL as the frame identifier for element_selector
-            element = await self.element_selector.find_element(selector, frame_id=frame_id) # Pass frame_id for context
-            if not element:
-                if self.diagnostics_manager:
-                    self.diagnostics_manager.error(f"Custom select: Failed to find element '{selector}' in frame {frame_id}")
-            if not element:
-                if self.diagnostics_manager:
-                    self.diagnostics_manager.error(f"Custom select: Failed to find element '{selector}'")
-                return False
-            
-            # Click to open the dropdown
-            try:
-                await element.click(timeout=3000)
-                if self.diagnostics_manager:
-                    self.diagnostics_manager.debug(f"Custom select: Clicked element to open dropdown: {selector}")
-                await asyncio.sleep(0.5)  # Wait for dropdown to open
-            except Exception as click_err:
-                 self.logger.warning(f"Custom select: Failed to click element {selector} to open dropdown: {click_err}")
-                 # Proceed to try typing anyway, maybe click wasn't needed
-                 pass
-            
-            # Try to find and click options that match the target_text
-            # Pass the frame object here, as _try_click_option works within that frame
-            option_clicked = await self._try_click_option(frame, target_text) 
-            if option_clicked:
-                if self.diagnostics_manager:
-                    self.diagnostics_manager.debug(f"Custom select: Clicked option matching '{target_text}'")
-                # Verify selection using the target_text
-                if await verify_selection(frame, selector, target_text):
+            # Resolve the element selector's frame once; fall back to the URL only for a frame we didn't get by ID
+            element_frame_id = frame_id if frame_id else (frame.url if frame is not self.browser.page else None)
+            
+            # Try whichever approach worked for this selector last time first
+            attempts = (
+                functools.partial(self._try_standard_select, frame, selector, value, label),
+                functools.partial(self._try_custom_select, frame, selector, value, label, element_frame_id),
+            )
+            if self._get_cached_select_strategy(selector) in _CUSTOM_SELECT_STRATEGIES:
+                attempts = attempts[::-1]
+            for attempt in attempts:
+                strategy = await attempt()
+                if strategy:
+                    self._cache_select_strategy(selector, strategy)
                     return True
             
-            # If clicking failed, try typing the target_text and pressing Enter
-            self.logger.debug(f"Custom select: Clicking option failed. Trying to type '{target_text}' and press Enter.")
-            try:
-                await element.fill("")  # Clear any existing text
-                await element.type(target_text, delay=50) # Add slight delay
-                if self.diagnostics_manager:
-                    self.diagnostics_manager.debug(f"Custom select: Typed '{target_text}' into element: {selector}")
-                await asyncio.sleep(0.7)  # Give time for suggestions/filtering
-                
-                # Try pressing Enter
-                await element.press("Enter")
-                if self.diagnostics_manager:
-                    self.diagnostics_manager.debug(f"Custom select: Pressed Enter in {selector}")
-                await asyncio.sleep(0.5)  # Wait for selection to apply
-                
-                # Final verification using target_text
-                if await verify_selection(frame, selector, target_text):
-                    return True
-            except Exception as type_err:
-                 self.logger.warning(f"Custom select: Error during type/enter sequence for {selector}: {type_err}")
-
             # If all strategies fail, log an error and return False
             if self.diagnostics_manager:
                 self.diagnostics_manager.error(f"Failed to select option for {log_target} after trying all strategies")
@@ -336,6 +647,122 @@ class FormInteraction:
                 self.diagnostics_manager.error(f"Unexpected error in select_option for {log_target}: {e}", exc_info=True)
             return False
     
+    def _get_cached_select_strategy(self, selector: str) -> Optional[str]:
+        """Return the select strategy that last worked for a selector, marking it recently used."""
+        strategy = self._select_strategy_cache.get(selector)
+        if strategy is not None:
+            self._select_strategy_cache.move_to_end(selector)
+        return strategy
+    
+    def _cache_select_strategy(self, selector: str, strategy: str) -> None:
+        """Remember the strategy that selected an option for a selector, evicting the oldest entry."""
+        self._select_strategy_cache[selector] = strategy
+        self._select_strategy_cache.move_to_end(selector)
+        if len(self._select_strategy_cache) > SELECT_STRATEGY_CACHE_SIZE:
+            self._select_strategy_cache.popitem(last=False)
+    
+    async def _try_standard_select(self, frame, selector: str, value: Optional[str], label: Optional[str]) -> Optional[str]:
+        """Select with Playwright's select_option by label and/or value.
+        
+        Returns:
+            "label" or "value" for the attempt that was verified, None if neither was
+        """
+        # Try by label first if provided, as it often corresponds to user intent.
+        # The attempts stay sequential: a select_option already sent to the browser
+        # can't be recalled, so a late one could overwrite a verified choice.
+        attempts = []
+        if label is not None:
+            attempts.append(("label", label))
+        if value is not None:
+            attempts.append(("value", value))
+        
+        for kind, target in attempts:
+            try:
+                self.logger.debug(f"Trying standard select by {kind}: {target}")
+                await frame.select_option(selector, timeout=SHORT_TIMEOUT, **{kind: target})
+                if self.diagnostics_manager:
+                    self.diagnostics_manager.debug(f"Selected option by {kind} for '{selector}': {target}")
+                # Verify selection based on the label/value we tried to select
+                if await verify_selection(frame, selector, target):
+                    return kind
+            except Exception as e:
+                if self.diagnostics_manager:
+                    self.diagnostics_manager.debug(f"Failed standard select by {kind} for '{selector}': {e}")
+        return None
+    
+    async def _try_custom_select(
+        self,
+        frame,
+        selector: str,
+        value: Optional[str],
+        label: Optional[str],
+        frame_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Select on a custom dropdown by clicking a matching option, then by typing and pressing Enter.
+        
+        Args:
+            frame: The frame containing the dropdown
+            selector: CSS selector of the dropdown element
+            value: Value attribute of the option to select
+            label: Visible text/label of the option to select
+            frame_id: Frame ID passed to element_selector.find_element, None for the main page
+        
+        Returns:
+            "click" or "type" for the approach that was verified, None if neither was
+        """
+        target_text = label if label is not None else value
+        self.logger.debug(f"Trying custom interaction for '{selector}' using target text: '{target_text}'")
+        
+        # Get the element using the selector string, not the frame
+        element = await self.element_selector.find_element(selector, frame_id=frame_id) # Pass frame_id for context
+        if not element:
+            if self.diagnostics_manager:
+                self.diagnostics_manager.error(f"Custom select: Failed to find element '{selector}' in frame {frame_id}")
+            return None
+        
+        # Click to open the dropdown
+        try:
+            await element.click(timeout=3000)
+            if self.diagnostics_manager:
+                self.diagnostics_manager.debug(f"Custom select: Clicked element to open dropdown: {selector}")
+            await asyncio.sleep(0.5)  # Wait for dropdown to open
+        except Exception as click_err:
+             self.logger.warning(f"Custom select: Failed to click element {selector} to open dropdown: {click_err}")
+             # Proceed to try typing anyway, maybe click wasn't needed
+             pass
+        
+        # Try to find and click options that match the target_text
+        # Pass the frame object here, as _try_click_option works within that frame
+        option_clicked = await self._try_click_option(frame, target_text) 
+        if option_clicked:
+            if self.diagnostics_manager:
+                self.diagnostics_manager.debug(f"Custom select: Clicked option matching '{target_text}'")
+            # Verify selection using the target_text
+            if await verify_selection(frame, selector, target_text):
+                return "click"
+        
+        # If clicking failed, try typing the target_text and pressing Enter
+        self.logger.debug(f"Custom select: Clicking option failed. Trying to type '{target_text}' and press Enter.")
+        try:
+            await element.fill("")  # Clear any existing text
+            await element.type(target_text, delay=50) # Add slight delay
+            if self.diagnostics_manager:
+                self.diagnostics_manager.debug(f"Custom select: Typed '{target_text}' into element: {selector}")
+            await asyncio.sleep(0.7)  # Give time for suggestions/filtering
+            
+            # Try pressing Enter
+            await element.press("Enter")
+            if self.diagnostics_manager:
+                self.diagnostics_manager.debug(f"Custom select: Pressed Enter in {selector}")
+            await asyncio.sleep(0.5)  # Wait for selection to apply
+            
+            # Final verification using target_text
+            if await verify_selection(frame, selector, target_text):
+                return "type"
+        except Exception as type_err:
+             self.logger.warning(f"Custom select: Error during type/enter sequence for {selector}: {type_err}")
+        return None
+    
     async def _try_click_option(self, frame, value: str) -> bool:
         """Try to click an option in an open dropdown based on its text.
         
@@ -348,113 +775,59 @@ class FormInteraction:
         """
         try:
             # Create variations of the value to increase chances of finding a match
-            value_variations = [
-                value,
-                value.strip(),
-                value.lower(),
-                value.upper(),
-                value.title(),
-                re.sub(r'[^\w\s]', '', value),  # Remove special characters
-            ]
-            
-            # Generate additional variations for specific value types
-            if ', ' in value:  # Location format like "City, State"
-                parts = value.split(', ')
-                if len(parts) >= 2:
-                    value_variations.append(parts[0])  # Just the city
-                    value_variations.append(parts[0] + ', ' + parts[1])  # City, State
-            
-            # Remove duplicates
-            value_variations = list(set(value_variations))
-            
-            # Try each selector with each value variation
-            for v in value_variations:
-                # Combine exact and general selectors for this variation
-                selectors_to_check = [
-                    f"div[role='option']:has-text('{v}')",
-                    f"li:has-text('{v}')",
-                    f"option:has-text('{v}')",
-                    f"[role='option']:has-text('{v}')",
-                    f".dropdown-item:has-text('{v}')",
-                    f".select-option:has-text('{v}')",
-                    f".autocomplete-result:has-text('{v}')",
-                    f"text='{v}'",
-                    f"div[role='option']:text-is('{v}')",
-                    f"li:text-is('{v}')",
-                    f"option:text-is('{v}')",
-                    f"[role='option']:text-is('{v}')"
-                ]
-                selector_to_try = "" # Initialize selector_to_try
-                for selector_template in selectors_to_check:
-                    try:
-                        selector_to_try = selector_template # Assign before potential exception
-                        option = await frame.query_selector(selector_to_try)
-
-                        if option:
-                            is_visible = await option.is_visible()
-                            if is_visible:
-                                await option.click()
-                                if self.diagnostics_manager:
-                                    self.diagnostics_manager.debug(f"Clicked dropdown option with selector: {selector_to_try}")
-                                return True
-                    except Exception as e:
-                        if self.diagnostics_manager:
-                            # Ensure selector_to_try has a value even if query_selector fails
-                            log_selector = selector_to_try if selector_to_try else selector_template
-                            self.diagnostics_manager.debug(f"Error trying selector {log_selector} with value '{v}': {str(e)}")
-                        continue
-
-            # If specific selectors failed, try a more general approach with contains()
-            for v in value_variations:
+            value_variations = _generate_value_variations(value)
+            
+            # Query the option-scoped and the bare-text selectors for every value variation
+            # concurrently; query_selector_all has no side effects, and matches are still
+            # taken in variation order, option-scoped before bare text
+            templates = (_OPTION_SELECTOR_TEMPLATE, _BARE_TEXT_SELECTOR_TEMPLATE)
+            results = await asyncio.gather(
+                *(self._bounded_qs(frame, template.format(v=v)) for v in value_variations for template in templates),
+                return_exceptions=True
+            )
+            for index, options in enumerate(results):
+                v = value_variations[index // len(templates)]
                 try:
-                    # Use XPath for more flexibility with contains()
-                    xpath_selector = f"//div[contains(text(), '{v}')][@role='option'] | //li[contains(text(), '{v}')] | //option[contains(text(), '{v}')]"
-                    option = await frame.query_selector(f"xpath={xpath_selector}")
-                    if option and await option.is_visible():
-                        await option.click()
-                        if self.diagnostics_manager:
-                            self.diagnostics_manager.debug(f"Clicked dropdown option using XPath contains for '{v}'")
-                        return True
+                    if isinstance(options, Exception):
+                        raise options
+                    for option in options:
+                        if await option.is_visible():
+                            await option.click()
+                            if self.diagnostics_manager:
+                                self.diagnostics_manager.debug(f"Clicked dropdown option matching '{v}'")
+                            return True
                 except Exception as e:
                     if self.diagnostics_manager:
-                        self.diagnostics_manager.debug(f"XPath contains approach failed for '{v}': {str(e)}")
+                        self.diagnostics_manager.debug(f"Error trying option selectors with value '{v}': {str(e)}")
+
+            # If specific selectors failed, try a more general approach with contains()
+            # One XPath covers every variation; visibility is read for the matched handles in one
+            # call, and the click goes to the same handle, so a menu re-render can't shift the index
+            try:
+                options = await self._bounded_qs(frame, _option_contains_xpath(value_variations))
+                snapshot = await frame.evaluate(OPTION_SNAPSHOT_JS, options) if options else []
+                visible = next((option for option in snapshot if option["visible"]), None)
+                if visible:
+                    await options[visible["i"]].click()
+                    if self.diagnostics_manager:
+                        self.diagnostics_manager.debug(f"Clicked dropdown option using XPath contains: '{visible['text']}'")
+                    return True
+            except Exception as e:
+                if self.diagnostics_manager:
+                    self.diagnostics_manager.debug(f"XPath contains approach failed for '{value}': {str(e)}")
             
             # Fuzzy matching approach for options that don't match exactly
             try:
-                # Get all visible options
-                option_selectors = [
-                    "div[role='option']", 
-                    "li[role='option']", 
-                    "option", 
-                    "[role='option']", 
-                    ".dropdown-item", 
-                    ".select-option",
-                    ".autocomplete-result"
-                ]
-                
-                best_match = None
-                best_score = 0
-                
-                for opt_selector in option_selectors:
-                    options = await frame.query_selector_all(opt_selector)
-                    
-                    for option in options:
-                        if not await option.is_visible():
-                            continue
-                            
-                        option_text = await option.text_content()
-                        if not option_text:
-                            continue
-                        
-                        # Calculate similarity score
-                        similarity = difflib.SequenceMatcher(None, value.lower(), option_text.lower()).ratio()
-                        
-                        if similarity > 0.6 and similarity > best_score:
-                            best_match = option
-                            best_score = similarity
+                # Snapshot the text and visibility of the queried option handles in one JS call;
+                # the winner is clicked through the same handle list the snapshot indexes
+                options = await frame.query_selector_all(_FUZZY_OPTION_SELECTOR)
+                snapshot = await frame.evaluate(OPTION_SNAPSHOT_JS, options) if options else []
+                visible_options = [option for option in snapshot if option["visible"]]
                 
-                if best_match:
-                    await best_match.click()
+                match = _best_option_match(value, [option["text"] for option in visible_options])
+                if match:
+                    best_index, best_score = match
+                    await options[visible_options[best_index]["i"]].click()
                     if self.diagnostics_manager:
                         self.diagnostics_manager.debug(f"Clicked best match option with similarity {best_score:.2f}")
                     return True
@@ -571,14 +944,12 @@ class FormInteraction:
                  self.logger.debug(f"VerifyInputValue: Could not retrieve value for {selector}.")
                  return False
 
-            # Use thefuzz for potentially better fuzzy matching
-            try:
-                 similarity = fuzz.ratio(expected_value.lower(), current_value.lower()) / 100.0
-            except NameError:
-                 self.logger.warning("VerifyInputValue: 'fuzz' not defined, falling back to difflib.")
-                 similarity = difflib.SequenceMatcher(None, expected_value.lower(), current_value.lower()).ratio()
+            # Cheap exact/substring checks first, thefuzz only when those miss
+            expected_norm = expected_value.strip().lower()
+            current_norm = current_value.strip().lower()
+            similarity = _score_pair(expected_norm, current_norm)
 
-            self.logger.debug(f"VerifyInputValue: Comparing '{expected_value.lower()}' vs '{current_value.lower()}' -> Similarity: {similarity:.3f}")
+            self.logger.debug(f"VerifyInputValue: Comparing '{expected_norm}' vs '{current_norm}' -> Similarity: {similarity:.3f}")
 
             if similarity >= threshold:
                 self.logger.info(f"VerifyInputValue: Selection for {selector} matches '{expected_value}' (Similarity: {similarity:.3f}, Threshold: {threshold})")
@@ -595,16 +966,15 @@ class FormInteraction:
     async def _get_element_value_for_verification(self, frame_or_page, selector: str) -> Optional[str]:
          """Attempts to get the most relevant value (input value or text content) for verification."""
          try:
-             element = await frame_or_page.query_selector(selector)
-             if not element:
+             # One evaluate call reads both the value and the text of the element
+             result = await frame_or_page.evaluate(ELEMENT_VALUE_JS, selector)
+             if not result:
                  return None
-             # Prioritize input_value as it reflects the actual selected value for inputs/selects
-             value = await element.input_value()
-             if value is not None: # Check for None explicitly, empty string is valid
-                  return value
-             # Fallback to text_content if input_value is None (e.g., for divs displaying selection)
-             text = await element.text_content()
-             return text.strip() if text else None # Return None if text is also empty/None
+             # Prioritize the input value as it reflects the actual selected value for inputs/selects
+             if result["v"] is not None: # Check for None explicitly, empty string is valid
+                  return result["v"]
+             # Fallback to text content when there is no value (e.g., for divs displaying selection)
+             return result["t"] or None # Return None if text is also empty
          except Exception as e:
               self.logger.debug(f"_get_element_value: Error getting value for {selector}: {e}")
               return None
@@ -638,51 +1008,35 @@ class FormInteraction:
 
         target_lower = target_text.lower().strip()
         best_match_element = None
-        best_score = 0.0
+        best_match_text = ""
+        best_score = 0
         found_exact = False
 
         for selector_group in option_selectors:
              try:
                   options_locator = frame.locator(selector_group)
-                  count = await options_locator.count()
-                  # Limit checks for performance
-                  for i in range(min(count, 50)):
-                       option = options_locator.nth(i)
-                       try:
-                            if not await option.is_visible(timeout=200): continue # Skip non-visible quickly
-
-                            option_text_content = await option.text_content()
-                            if not option_text_content: continue
-
-                            option_text_lower = option_text_content.strip().lower()
-                            if not option_text_lower: continue
-
-                            if exact_match:
-                                 if option_text_lower == target_lower:
-                                      best_match_element = option
-                                      found_exact = True
-                                      self.logger.debug(f"_find_and_click: Found exact match: '{option_text_content}' using selector group: {selector_group}")
-                                      break # Found exact match, stop inner loop
-                            else:
-                                 # Use fuzzy matching
-                                 try:
-                                      score = fuzz.ratio(target_lower, option_text_lower) / 100.0
-                                 except NameError:
-                                      score = difflib.SequenceMatcher(None, target_lower, option_text_lower).ratio()
-
-                                 # Use a relatively high threshold for fuzzy selection
-                                 if score > HIGH_FUZZY_THRESHOLD and score > best_score:
-                                      best_score = score
-                                      best_match_element = option
-                                      self.logger.debug(f"_find_and_click: Found new best fuzzy match: '{option_text_content}' (Score: {score:.2f}) using selector group: {selector_group}")
-                                      # Optimization: if score is near perfect, consider it good enough
-                                      if score > 0.98: break
-
-                       except Exception as inner_e:
-                            self.logger.debug(f"_find_and_click: Error processing option {i} with '{selector_group}': {inner_e}")
-                            continue # Ignore errors on individual options
-
-                  if found_exact or (not exact_match and best_score > 0.8):
+                  # Text and visibility of every option in the group, in a single round-trip
+                  snapshot = await options_locator.evaluate_all(OPTION_SNAPSHOT_JS)
+                  visible_options = [option for option in snapshot if option["visible"] and option["text"]]
+
+                  if exact_match:
+                       for option in visible_options:
+                            if option["text"].lower() == target_lower:
+                                 best_match_element = options_locator.nth(option["i"])
+                                 best_match_text = option["text"]
+                                 found_exact = True
+                                 self.logger.debug(f"_find_and_click: Found exact match: '{best_match_text}' using selector group: {selector_group}")
+                                 break # Found exact match, stop inner loop
+                  else:
+                       # Score every visible option in one call, on the 0-100 scale
+                       match = _best_fuzzy_option(target_lower, [option["text"] for option in visible_options], HIGH_FUZZY_THRESHOLD_PCT)
+                       if match:
+                            index, best_score = match
+                            best_match_element = options_locator.nth(visible_options[index]["i"])
+                            best_match_text = visible_options[index]["text"]
+                            self.logger.debug(f"_find_and_click: Found best fuzzy match: '{best_match_text}' (Score: {best_score:.1f}) using selector group: {selector_group}")
+
+                  if best_match_element is not None:
                        break # Exit outer loop if a good match was found
 
              except Exception as outer_e:
@@ -692,16 +1046,16 @@ class FormInteraction:
         # Click the best match found
         if best_match_element:
             try:
-                option_text_final = await best_match_element.text_content() # Get text again for logging
-                self.logger.info(f"_find_and_click: Attempting to click best match: '{option_text_final}' (Exact: {found_exact}, Score: {best_score:.2f})")
+                self.logger.info(f"_find_and_click: Attempting to click best match: '{best_match_text}' (Exact: {found_exact}, Score: {best_score:.1f})")
                 await best_match_element.click(timeout=VISIBILITY_TIMEOUT)
-                self.logger.info(f"_find_and_click: Successfully clicked option '{option_text_final}'.")
-                # --- ADD DISMISSAL --- #
-                await self._try_dismiss_dropdown(best_match_element, frame)
-                # --- END DISMISSAL --- #
+                self.logger.info(f"_find_and_click: Successfully clicked option '{best_match_text}'.")
+                # Most menus close themselves on click; only send Escape if one is still open
+                await asyncio.sleep(0.05)
+                if await self._dropdown_still_open(frame):
+                    await self._try_dismiss_dropdown(best_match_element, frame)
                 return True
             except Exception as click_e:
-                self.logger.warning(f"_find_and_click: Failed to click best match option '{await best_match_element.text_content()}': {click_e}")
+                self.logger.warning(f"_find_and_click: Failed to click best match option '{best_match_text}': {click_e}")
                 # Attempt dismissal even on failure?
                 await self._try_dismiss_dropdown(best_match_element, frame) # Try dismiss even if click fails
                 return False
@@ -713,7 +1067,7 @@ class FormInteraction:
     async def get_field_value(self, selector: str, frame_id: Optional[str] = None) -> str:
         """Get the value of a field."""
         # --- Simplified: Use the new helper ---
-        frame = await self.browser.get_frame(frame_id) if frame_id else self.browser.page
+        frame = await self._get_frame(frame_id) if frame_id else self.browser.page
         value = await self._get_element_value_for_verification(frame, selector)
         return value if value is not None else ""
         # --- End Simplification ---
@@ -739,7 +1093,7 @@ class FormInteraction:
             
         try:
             # Get the frame if needed
-            frame = await self.browser.get_frame(frame_id) if frame_id else None
+            frame = await self._get_frame(frame_id) if frame_id else None
             context = frame or self.browser.page
             
             # Find the checkbox
@@ -785,7 +1139,7 @@ class FormInteraction:
             
         try:
             # Get the frame if needed
-            frame = await self.browser.get_frame(frame_id) if frame_id else None
+            frame = await self._get_frame(frame_id) if frame_id else None
             context = frame or self.browser.page
             
             # Find the file input
@@ -824,7 +1178,7 @@ class FormInteraction:
                 return True
             
             if frame_id:
-                frame = await self.browser.get_frame(frame_id)
+                frame = await self._get_frame(frame_id)
                 if frame:
                     try:
                         await frame.click(selector)
@@ -867,26 +1221,13 @@ class FormInteraction:
             True if successful, False otherwise
         """
         # Generate variants of the value for fallback attempts
-        variants = [value]
-        if field_type:
-            # Add common variants based on field type
-            if field_type == "school" and "university" in value.lower():
-                variants.extend([
-                    value.replace("University", "Univ"),
-                    value.replace("University of", ""),
-                    value.split(",")[0]  # First part before comma
-                ])
-            elif field_type == "degree":
-                if "Bachelor" in value:
-                    variants.extend(["BS", "B.S.", "Bachelor's"])
-                elif "Master" in value:
-                    variants.extend(["MS", "M.S.", "Master's"])
+        variants = self._generate_typeahead_variants(value, field_type)
             
         self.logger.info(f"Handling standard typeahead for '{value}' in {selector}")
         
         try:
             # Get the frame if needed
-            frame = await self.browser.get_frame(frame_id) if frame_id else None
+            frame = await self._get_frame(frame_id) if frame_id else None
             
             # First try direct input with tab
             element = await self.element_selector.wait_for_element(selector, frame=frame)
@@ -926,23 +1267,8 @@ class FormInteraction:
             return False
             
         try:
-            # Common dropdown selectors
-            dropdown_selectors = [
-                'ul[role="listbox"]', 
-                '.dropdown-menu', 
-                '[role="listbox"]',
-                '.select-dropdown',
-                '.autocomplete-results'
-            ]
-            
-            for selector in dropdown_selectors:
-                dropdown = await page.query_selector(selector)
-                if dropdown:
-                    is_visible = await dropdown.is_visible()
-                    if is_visible:
-                        return True
-            
-            return False
+            # All common dropdown containers checked in-page in one round-trip
+            return await page.evaluate(ANY_VISIBLE_JS, _DROPDOWN_CONTAINER_SELECTOR)
             
         except Exception as e:
             self.logger.debug(f"Error checking dropdown visibility: {str(e)}")
@@ -955,24 +1281,8 @@ class FormInteraction:
             return False
             
         try:
-            # Common option selectors
-            option_selectors = [
-                'li[role="option"]', 
-                '.dropdown-item', 
-                '[role="option"]',
-                '.select-option',
-                '.autocomplete-result'
-            ]
-            
-            for selector in option_selectors:
-                options = await page.query_selector_all(selector)
-                for option in options:
-                    is_visible = await option.is_visible()
-                    if is_visible:
-                        await option.click()
-                        return True
-            
-            return False
+            # Find and click the first visible option in-page, in one round-trip
+            return await page.evaluate(CLICK_FIRST_VISIBLE_JS, _DROPDOWN_OPTION_SELECTOR)
             
         except Exception as e:
             self.logger.debug(f"Error selecting dropdown option: {str(e)}")
@@ -1002,7 +1312,7 @@ class FormInteraction:
             page = self.browser.page
             
             # Get the frame if needed
-            frame = await self.browser.get_frame(frame_id) if frame_id else None
+            frame = await self._get_frame(frame_id) if frame_id else None
             
             if frame:
                 frame_obj = await self.browser.page.frame(frame)
@@ -1037,216 +1347,17 @@ class FormInteraction:
                 await asyncio.sleep(0.8)  # Wait for dropdown to fully populate
                 
                 # Get dropdown options using JavaScript
-                dropdown_options = await js_context.evaluate("""
-                    () => {
-                        const optionSelectors = [
-                            '[role="option"]', '.select__option', '.dropdown-item',
-                            'li[id*="react-select"]', 'li.option', '[role="listbox"] > *',
-                            '.select__menu .select__option', '[class*="select"] [class*="option"]',
-                            '.autocomplete-item', '[role="listitem"]'
-                        ];
-                        
-                        for (const selector of optionSelectors) {
-                            const options = Array.from(document.querySelectorAll(selector));
-                            if (options.length > 0) {
-                                return options.map(opt => ({
-                                    text: opt.textContent.trim(),
-                                    label: opt.getAttribute('aria-label') || '',
-                                    selected: opt.getAttribute('aria-selected') === 'true',
-                                    value: opt.getAttribute('data-value') || '',
-                                    element: selector
-                                }));
-                            }
-                        }
-                        return [];
-                    }
-                """)
+                dropdown_options = await js_context.evaluate(_DROPDOWN_OPTIONS_JS)
                 
                 # Find the best match among the options
                 if dropdown_options and len(dropdown_options) > 0:
                     self.logger.debug(f"Found {len(dropdown_options)} dropdown options")
                     
-                    # JS script for matching the best option
-                    js_script = """
-                    (args) => {
-                        const { selector, value, variants, options } = args;
-                        
-                        // Find the input element
-                        const input = document.querySelector(selector);
-                        if (!input) return { success: false, error: "Input not found" };
-                        
-                        // Normalize text for comparison
-                        const normalize = (text) => {
-                            return text.toLowerCase()
-                                .replace(/[^\w\s]/g, ' ')
-                                .replace(/\s+/g, ' ')
-                                .trim();
-                        };
-                        
-                        // Score function - generic pattern matching for all schools
-                        const scoreMatch = (option, searchValue) => {
-                            const optionText = normalize(option.text);
-                            const searchText = normalize(searchValue);
-                            
-                            // Exact match
-                            if (optionText === searchText) return 1.0;
-                            
-                            // Get main parts of school name for matching
-                            const searchParts = searchText.split(/,|\s-\s/); // Split by comma or dash
-                            const mainSearchPart = searchParts[0].trim();
-                            
-                            // Pattern detection - handle different university formats
-                            const isSearchUnivOfX = searchText.includes('university of');
-                            const isOptionUnivOfX = optionText.includes('university of');
-                            
-                            // Matching patterns have priority (both "University of X" or both "X University")
-                            if ((isSearchUnivOfX && isOptionUnivOfX) ||
-                                (!isSearchUnivOfX && !isOptionUnivOfX && 
-                                 searchText.includes('university') && optionText.includes('university'))) {
-                                  
-                                // If main names match after "University of"
-                                if (isSearchUnivOfX && isOptionUnivOfX) {
-                                    const searchMain = searchText.replace('university of', '').trim().split(',')[0];
-                                    const optionMain = optionText.replace('university of', '').trim().split(',')[0];
-                                    
-                                    if (searchMain === optionMain) return 0.99; // Almost perfect
-                                    if (optionMain.includes(searchMain) || searchMain.includes(optionMain)) return 0.9;
-                                }
-                                // For "X University" pattern
-                                else if (searchText.includes('university') && optionText.includes('university')) {
-                                    const searchPart = searchText.split('university')[0].trim();
-                                    const optionPart = optionText.split('university')[0].trim();
-                                    
-                                    if (searchPart === optionPart) return 0.99; // Almost perfect
-                                    if (optionPart.includes(searchPart) || searchPart.includes(optionPart)) return 0.9;
-                                }
-                            }
-                            
-                            // College pattern matching
-                            const isSearchCollege = searchText.includes('college');
-                            const isOptionCollege = optionText.includes('college');
-                            if (isSearchCollege && isOptionCollege) {
-                                const searchPart = searchText.split('college')[0].trim();
-                                const optionPart = optionText.split('college')[0].trim();
-                                
-                                if (searchPart === optionPart) return 0.99; // Almost perfect
-                                if (optionPart.includes(searchPart) || searchPart.includes(optionPart)) return 0.9;
-                            }
-                            
-                            // Direct contains match
-                            if (optionText.includes(mainSearchPart)) return 0.85;
-                            if (mainSearchPart.includes(optionText)) return 0.75;
-                            
-                            // Contains match with main part before comma/dash
-                            for (const part of searchParts) {
-                                const trimmedPart = part.trim();
-                                if (trimmedPart.length > 3 && optionText.includes(trimmedPart)) {
-                                    return 0.8;
-                                }
-                            }
-                            
-                            // Word matching
-                            const optWords = optionText.split(' ');
-                            const searchWords = searchText.split(' ');
-                            let matchedWords = 0;
-                            
-                            // Count important words that match (ignore common words)
-                            const ignoreWords = ['the', 'and', 'of', 'or', 'for', 'in', 'at', 'a', 'an'];
-                            for (const word of searchWords) {
-                                if (word.length > 3 && !ignoreWords.includes(word)) {
-                                    if (optWords.some(w => w.includes(word) || word.includes(w))) {
-                                        matchedWords++;
-                                    }
-                                }
-                            }
-                            
-                            // Calculate word match score
-                            const importantWords = searchWords.filter(w => 
-                                w.length > 3 && !ignoreWords.includes(w)
-                            ).length;
-                            
-                            return importantWords > 0 ? (matchedWords / importantWords) * 0.6 : 0;
-                        };
-                        
-                        // Find best match
-                        let bestOption = null;
-                        let bestScore = 0;
-                        let bestMatchInfo = '';
-                        let allMatches = [];
-                        
-                        // Try each variant against all options
-                        for (const variant of variants) {
-                            for (const option of options) {
-                                const score = scoreMatch(option, variant);
-                                
-                                // Store all decent matches for logging
-                                if (score > 0.5) {
-                                    allMatches.push({
-                                        option: option.text,
-                                        variant: variant,
-                                        score: score.toFixed(2)
-                                    });
-                                }
-                                
-                                if (score > bestScore) {
-                                    bestScore = score;
-                                    bestOption = option;
-                                    bestMatchInfo = `Score: ${score.toFixed(2)} with variant: ${variant}`;
-                                }
-                            }
-                        }
-                        
-                        console.log(`Best match: ${bestOption ? bestOption.text : 'none'}, ${bestMatchInfo}`);
-                        console.log(`All promising matches: ${JSON.stringify(allMatches)}`);
-                        
-                        // Select the best option if score is good enough
-                        if (bestOption && bestScore > 0.5) {
-                            try {
-                                // For React-select or similar components
-                                const matchingOptions = Array.from(
-                                    document.querySelectorAll(bestOption.element)
-                                ).filter(el => el.textContent.trim() === bestOption.text);
-                                
-                                if (matchingOptions.length > 0) {
-                                    matchingOptions[0].click();
-                                    return { 
-                                        success: true, 
-                                        selectedOption: bestOption.text,
-                                        score: bestScore
-                                    };
-                                }
-                            } catch (e) {
-                                console.error("Error clicking option:", e);
-                            }
-                        }
-                        
-                        // If we couldn't find a good match, try the first option
-                        if (options.length > 0) {
-                            try {
-                                const firstOption = document.querySelector(options[0].element);
-                                if (firstOption) {
-                                    firstOption.click();
-                                    return { 
-                                        success: true, 
-                                        selectedOption: options[0].text,
-                                        fallback: true
-                                    };
-                                }
-                            } catch (e) {
-                                console.error("Error clicking first option:", e);
-                            }
-                        }
-                        
-                        return { success: false, error: "No match found" };
-                    }
-                    """
-                    
-                    result = await js_context.evaluate(js_script, {
-                        "selector": selector,
-                        "value": value,
-                        "variants": variants,
-                        "options": dropdown_options
-                    })
+                    # Score every variant against every option in Python
+                    result = await self._click_best_variant_option(js_context, variants, dropdown_options)
+                    if result is None:
+                        # If we couldn't find a good match, try the first option
+                        result = await js_context.evaluate(_CLICK_FIRST_OPTION_JS, dropdown_options[0])
                     
                     if result and result.get('success'):
                         selected_option = result.get('selectedOption', 'Unknown')
@@ -1324,6 +1435,29 @@ class FormInteraction:
                 
             return False
     
+    async def _click_best_variant_option(self, js_context, variants: List[str], options: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Click the scraped option that best matches any of the variants.
+        
+        Args:
+            js_context: Page or frame the options were scraped from
+            variants: Variants of the value being selected
+            options: Options returned by _DROPDOWN_OPTIONS_JS
+        
+        Returns:
+            {"success": True, "selectedOption": ..., "score": ...}, or None if no option matched or the click failed
+        """
+        match = _best_variant_option(variants, [option["text"] for option in options], TYPEAHEAD_MATCH_CUTOFF)
+        if not match:
+            return None
+        index, score = match
+        option = options[index]
+        try:
+            await js_context.locator(option["element"]).get_by_text(option["text"], exact=True).first.click()
+        except Exception as e:
+            self.logger.debug(f"Failed to click best matching option '{option['text']}': {e}")
+            return None
+        return {"success": True, "selectedOption": option["text"], "score": score}
+    
     async def _type_school_name_strategically(self, element, school_name):
         """Type part of the school name in a way that's likely to show relevant options.
         
@@ -1441,7 +1575,7 @@ class FormInteraction:
             True if successful, raises exception otherwise
         """
         # Get the frame to use
-        frame = await self.browser.get_frame(frame_id)
+        frame = await self._get_frame(frame_id)
         
         # First clear the field
         await frame.fill(field_selector, "")
@@ -1731,6 +1865,28 @@ class FormInteraction:
             self.logger.debug(f"Error in _try_intelligent_typeahead_js: {str(e)}")
             return False
     
+    def _generate_typeahead_variants(self, value: str, field_type: Optional[str]) -> List[str]:
+        """Variants of a typeahead value to try, starting with the value itself.
+        
+        Results are memoized per (value, field_type), since retries and repeated
+        fields of the same kind ask for the same variants.
+        """
+        return list(self._typeahead_variant_cache(value, field_type))
+    
+    def _build_typeahead_variants(self, value: str, field_type: Optional[str]) -> Tuple[str, ...]:
+        """Dispatch to the variant generator for the field type; see _generate_typeahead_variants."""
+        if field_type == "school":
+            variants = self._generate_school_variants(value)
+        elif field_type == "degree":
+            variants = self._generate_degree_variants(value)
+        elif field_type == "location":
+            variants = self._generate_location_variants(value)
+        elif field_type:
+            variants = self._generate_general_selection_variants(value, field_type)
+        else:
+            variants = []
+        return tuple(dict.fromkeys(v for v in (value, *variants) if v))
+
     def _generate_general_selection_variants(self, value: str, field_type: str) -> List[str]:
         """
         Generate variants for general selection fields like gender, ethnicity, etc.
@@ -1856,7 +2012,7 @@ class FormInteraction:
             ])
             
             # Split by comma, hyphen, or other separators
-            split_parts = re.split(r'[,\-–\(\)]', base_name)
+            split_parts = _SCHOOL_SEPARATOR_RE.split(base_name)
             if len(split_parts) > 1:
                 main_part = split_parts[0].strip()
                 location = split_parts[1].strip()
@@ -1898,7 +2054,7 @@ class FormInteraction:
             
         # 3. "Institute of Technology" format
         elif "institute of technology" in name_lower or "polytechnic" in name_lower:
-            base_name = re.sub(r'institute of technology|polytechnic', '', name_lower).strip()
+            base_name = _INSTITUTE_RE.sub('', name_lower).strip()
             
             variants.extend([
                 f"{base_name.title()} Institute of Technology",
@@ -1919,8 +2075,8 @@ class FormInteraction:
                     variants.append(f"{initials}U")
         
         # Add variants with different punctuation and spacing
-        clean_name = re.sub(r'[^\w\s]', ' ', school_name)
-        clean_name = re.sub(r'\s+', ' ', clean_name).strip()
+        clean_name = _NON_ALNUM_RE.sub(' ', school_name)
+        clean_name = _WHITESPACE_RE.sub(' ', clean_name).strip()
         if clean_name != school_name:
             variants.append(clean_name)
         
@@ -1943,66 +2099,14 @@ class FormInteraction:
         Returns:
             List of variants
         """
-        variants = []
         degree_lower = degree.lower()
         
-        # Add original degree
-        variants.append(degree)
-        
-        # Add common degree variants
-        if "bachelor" in degree_lower or "bs" in degree_lower or "b.s." in degree_lower:
-            variants.extend([
-                "Bachelor of Science",
-                "Bachelor's Degree",
-                "Bachelor's degree",
-                "BS",
-                "B.S.",
-                "Bachelor",
-                "Bachelors",
-                "Bachelor's"
-            ])
-        elif "master" in degree_lower or "ms" in degree_lower or "m.s." in degree_lower:
-            variants.extend([
-                "Master of Science",
-                "Master's Degree",
-                "Master's degree",
-                "MS",
-                "M.S.",
-                "Master",
-                "Masters",
-                "Master's"
-            ])
-        elif "phd" in degree_lower or "ph.d" in degree_lower or "doctor" in degree_lower:
-            variants.extend([
-                "PhD",
-                "Doctor of Philosophy",
-                "Ph.D.",
-                "Doctorate",
-                "Doctoral Degree",
-                "Doctoral degree"
-            ])
-        elif "associate" in degree_lower or "aa" in degree_lower or "a.a." in degree_lower:
-            variants.extend([
-                "Associate Degree",
-                "Associate's Degree",
-                "Associate's degree",
-                "AA",
-                "A.A.",
-                "Associate",
-                "Associates",
-                "Associate's"
-            ])
-            
-        # Add general "degree" variants that will match with any degree type
-        variants.extend([
-            "Degree",
-            "degree",
-            "Any Degree",
-            "College Degree",
-            "Diploma"
-        ])
-            
-        return variants
+        # Original degree, the variants of the first degree type it mentions, then generic ones
+        specific = next(
+            (variants for markers, variants in _DEGREE_VARIANTS if any(m in degree_lower for m in markers)),
+            ()
+        )
+        return [degree, *specific, *_GENERIC_DEGREE_VARIANTS]
 
     def _generate_location_variants(self, location: str) -> List[str]:
         """Generate intelligent variants for location fields.
@@ -2024,10 +2128,10 @@ class FormInteraction:
         city = state = country = ""
         
         # Handle "City, State" format (like "San Francisco, CA")
-        city_state_match = re.match(r'([^,]+),\s*([A-Z]{2}|[^,]+)$', location)
+        city_state_match = _CITY_STATE_RE.match(location)
         
         # Handle "City, State, Country" format (like "San Francisco, California, USA")
-        city_state_country_match = re.match(r'([^,]+),\s*([^,]+),\s*([^,]+)$', location)
+        city_state_country_match = _CITY_STATE_COUNTRY_RE.match(location)
         
         if city_state_country_match:
             city, state, country = [x.strip() for x in city_state_country_match.groups()]
@@ -2044,28 +2148,14 @@ class FormInteraction:
             # Handle US state codes
             if country.upper() in ["USA", "US", "UNITED STATES"]:
                 # If state is a full name, add state code variant
-                us_state_map = {
-                    "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", "california": "CA",
-                    "colorado": "CO", "connecticut": "CT", "delaware": "DE", "florida": "FL", "georgia": "GA",
-                    "hawaii": "HI", "idaho": "ID", "illinois": "IL", "indiana": "IN", "iowa": "IA",
-                    "kansas": "KS", "kentucky": "KY", "louisiana": "LA", "maine": "ME", "maryland": "MD",
-                    "massachusetts": "MA", "michigan": "MI", "minnesota": "MN", "mississippi": "MS", "missouri": "MO",
-                    "montana": "MT", "nebraska": "NE", "nevada": "NV", "new hampshire": "NH", "new jersey": "NJ",
-                    "new mexico": "NM", "new york": "NY", "north carolina": "NC", "north dakota": "ND", "ohio": "OH",
-                    "oklahoma": "OK", "oregon": "OR", "pennsylvania": "PA", "rhode island": "RI", "south carolina": "SC",
-                    "south dakota": "SD", "tennessee": "TN", "texas": "TX", "utah": "UT", "vermont": "VT",
-                    "virginia": "VA", "washington": "WA", "west virginia": "WV", "wisconsin": "WI", "wyoming": "WY"
-                }
-                
                 state_lower = state.lower()
-                if state_lower in us_state_map:
-                    state_code = us_state_map[state_lower]
+                if state_lower in _US_STATE_CODES:
+                    state_code = _US_STATE_CODES[state_lower]
                     variants.add(f"{city}, {state_code}")
                 elif len(state) == 2:  # It's already a state code
                     # Try to find the full state name
-                    reverse_map = {v: k for k, v in us_state_map.items()}
-                    if state.upper() in reverse_map:
-                        full_state = reverse_map[state.upper()].title()
+                    if state.upper() in _US_STATE_NAMES:
+                        full_state = _US_STATE_NAMES[state.upper()].title()
                         variants.add(f"{city}, {full_state}")
         
         elif city_state_match:
@@ -2138,7 +2228,7 @@ class FormInteraction:
         frame = None
         try:
             # Correctly get frame object and frame_id string
-            frame = await self.browser.get_frame(frame_id_str) if frame_id_str else self.browser.page
+            frame = await self._get_frame(frame_id_str) if frame_id_str else self.browser.page
             if not frame:
                  self.logger.error(f"Failed to get frame object: {frame_id_str or 'main'}")
                  return False
@@ -2190,6 +2280,7 @@ class FormInteraction:
 
         except Exception as e:
             self.logger.error(f"Error in type_and_select_option_exact for selector {selector}: {str(e)}")
+            import traceback  # only needed on this error path
             self.logger.debug(traceback.format_exc())
             return False
 
@@ -2200,7 +2291,7 @@ class FormInteraction:
         best_match_text = None # Initialize here
         try:
             # 1. Get Element and Frame
-            frame = await self.browser.get_frame(frame_id_str) if frame_id_str else self.browser.page
+            frame = await self._get_frame(frame_id_str) if frame_id_str else self.browser.page
             if not frame:
                  self.logger.error(f"Fuzzy: Failed to get frame object: {frame_id_str or 'main'}")
                  return False
@@ -2248,6 +2339,7 @@ class FormInteraction:
 
         except Exception as e:
             self.logger.error(f"Fuzzy: Unexpected error during type and select for {selector}: {str(e)}")
+            import traceback  # only needed on this error path
             self.logger.debug(traceback.format_exc())
             # Attempt dismissal on general failure
             if frame and element:
@@ -2261,7 +2353,7 @@ class FormInteraction:
         if success:
             # Try pressing Tab to confirm/move focus
             try:
-                frame = await self.browser.get_frame(frame_id) if frame_id else self.browser.page
+                frame = await self._get_frame(frame_id) if frame_id else self.browser.page
                 element = await self.element_selector.find_element(selector, frame_id=frame_id)
                 if element:
                     await element.press('Tab')
@@ -2287,7 +2379,7 @@ class FormInteraction:
     async def clear_field(self, selector: str, frame_id: Optional[str] = None) -> None:
         """Clear the content of an input field."""
         try:
-            frame = await self.browser.get_frame(frame_id) if frame_id else self.browser.page
+            frame = await self._get_frame(frame_id) if frame_id else self.browser.page
             if frame:
                 await frame.locator(selector).clear()
                 self.logger.debug(f"Cleared field: {selector}")
@@ -2381,6 +2473,14 @@ class FormInteraction:
             self.logger.warning(f"No suitable match found for '{value}' in pre-scraped list for '{selector}' (threshold: {threshold}). Options considered: {option_texts[:10]}...")
             return False
 
+    async def _dropdown_still_open(self, frame) -> bool:
+        """Whether a dropdown menu or option is still visible in frame; assumes open if the check fails."""
+        try:
+            return await frame.evaluate(ANY_VISIBLE_JS, _OPEN_MENU_SELECTOR)
+        except Exception as e:
+            self.logger.debug(f"Could not check whether dropdown closed: {e}")
+            return True
+
     async def _try_dismiss_dropdown(self, element, frame) -> None:
         """Attempts to dismiss an open dropdown, usually by clicking the body or pressing Escape."""
         try:
@@ -479,6 +479,19 @@ class FieldDetector:
         self.page = page
         self.debug_mode = debug_mode
         self.logger = logger
+        # Successful lookups keyed by (field_name, (frame url, frame name), field_types)
+        self._field_cache: Dict[
+            Tuple[str, Optional[Tuple[str, str]], Optional[Tuple[str, ...]]], Tuple[str, Locator]
+        ] = {}
+        # Cached locators are stale once any frame navigates. Callers may pass the
+        # browser manager rather than the Page, so listen on the page it wraps.
+        events = page if hasattr(page, "on") else getattr(page, "page", None)
+        if hasattr(events, "on"):
+            events.on("framenavigated", self.clear_cache)
+        
+    def clear_cache(self, *_args) -> None:
+        """Forget cached field lookups; registered for framenavigated."""
+        self._field_cache.clear()
         
     async def find_field_by_name(
         self,
@@ -489,6 +502,9 @@ class FieldDetector:
         """
         Find a form field by name using multiple detection strategies.
         
+        Successful lookups are cached per detector, so repeated queries for the
+        same field skip the DOM walk until a frame navigates or clear_cache() is called.
+        
         Args:
             field_name: The name or label text to find
             frame: Optional frame to search in (uses page if None)
@@ -497,6 +513,25 @@ class FieldDetector:
         Returns:
             Tuple of (selector, locator) if found, None otherwise
         """
+        frame_key = (frame.url, frame.name) if frame else None
+        cache_key = (field_name, frame_key, tuple(field_types) if field_types else None)
+        cached = self._field_cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug(f"Using cached field for '{field_name}': {cached[0]}")
+            return cached
+            
+        result = await self._find_field_by_name_uncached(field_name, frame, field_types)
+        if result is not None:
+            self._field_cache[cache_key] = result
+        return result
+        
+    async def _find_field_by_name_uncached(
+        self,
+        field_name: str,
+        frame: Optional[Frame] = None,
+        field_types: Optional[List[str]] = None
+    ) -> Optional[Tuple[str, Locator]]:
+        """Run the detection strategies for find_field_by_name without consulting the cache."""
         self.logger.debug(f"Finding field by name: '{field_name}'")
         
         if not field_name:
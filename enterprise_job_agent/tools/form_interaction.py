@@ -191,28 +191,28 @@ class FormInteraction:
             
             # 1. Try standard select_option
             if label is not None:
-                 try:
+                try:
                     await frame.select_option(selector, label=label, timeout=SHORT_TIMEOUT)
                     self._log("debug", f"Selected option by label: {label}")
-                     if await verify_selection(frame, selector, label):
-                         return True
-                 except Exception as e:
+                    if await verify_selection(frame, selector, label):
+                        return True
+                except Exception as e:
                     self._log("debug", f"Failed standard select by label: {e}")
             
             if value is not None:
-                 try:
+                try:
                     await frame.select_option(selector, value=value, timeout=SHORT_TIMEOUT)
                     self._log("debug", f"Selected option by value: {value}")
-                     if await verify_selection(frame, selector, value):
-                         return True
-                 except Exception as e:
+                    if await verify_selection(frame, selector, value):
+                        return True
+                except Exception as e:
                     self._log("debug", f"Failed standard select by value: {e}")
             
             # 2. Try custom dropdown handling
             self.logger.debug(f"Trying custom interaction for {log_target}")
             
-            # Get the element 
-            element = await self.element_selector.find_element(selector, frame_id=frame.url)
+            # Get the element, in the caller's frame (frame_id is a logical ID, not a URL)
+            element = await self.element_selector.find_element(selector, frame_id=frame_id)
             if not element:
                 self._log("error", f"Failed to find element '{selector}'")
                 return False
@@ -320,7 +320,7 @@ class FormInteraction:
                         if option_elements:
                             options.extend(option_elements)
                             break
-                except Exception as e:
+                    except Exception as e:
                         logger.debug(f"Error finding options with selector {selector}: {e}")
             
             if not options:
@@ -331,20 +331,21 @@ class FormInteraction:
             value_variants = generate_answer_variants(value, field_type)
             logger.debug(f"Generated variants for matching: {value_variants}")
             
-            # Find best matching option
-                best_match = None
-                best_score = 0
+            # Find best matching option, keeping its text for logging
+            best_match = None
+            best_match_text = ""
+            best_score = 0
             threshold = 65  # Minimum similarity score (0-100)
-                    
-                    for option in options:
+            
+            for option in options:
                 try:
-                        option_text = await option.text_content()
+                    option_text = await option.text_content()
                     option_text = option_text.strip() if option_text else ""
                     
                     # Skip empty options or ones that are clearly separators
                     if not option_text or option_text == '-' or len(option_text) < 2:
-                            continue
-                        
+                        continue
+                    
                     # Calculate similarity using fuzzywuzzy for each variant
                     for variant in value_variants:
                         # Use local calculation or imported fuzzywuzzy
@@ -360,23 +361,22 @@ class FormInteraction:
                             similarity = 100
                         elif option_text.lower().startswith(variant.lower()):
                             similarity += 15
-                            
+                        
                         if similarity > best_score:
                             best_score = similarity
                             best_match = option
+                            best_match_text = option_text
                             if similarity == 100:
                                 break  # Perfect match found
-                                
+                    
                     if best_score == 100:
                         break  # Perfect match found in outer loop
-                    
-            except Exception as e:
+                
+                except Exception as e:
                     logger.debug(f"Error processing option: {e}")
-                    
+            
             if best_match and best_score >= threshold:
-                option_text = await best_match.text_content()
-                option_text = option_text.strip() if option_text else ""
-                logger.info(f"Selected option '{option_text}' with match score: {best_score}")
+                logger.info(f"Selected option '{best_match_text}' with match score: {best_score}")
                 
                 # Attempt to click the best matching option using multiple methods
                 try:
@@ -387,8 +387,8 @@ class FormInteraction:
                     is_closed = await self._verify_dropdown_closed(dropdown_selectors)
                     if is_closed:
                         logger.debug("Dropdown successfully closed after selection")
-                return True
-            
+                        return True
+                    
                     # Method 2: JavaScript click if normal click didn't work
                     frame = await self.browser.get_frame(frame_id) if frame_id else self.browser.page
                     await frame.evaluate('el => el.click()', best_match)
@@ -397,8 +397,8 @@ class FormInteraction:
                     is_closed = await self._verify_dropdown_closed(dropdown_selectors)
                     if is_closed:
                         logger.debug("Dropdown closed after JavaScript click")
-                return True
-                
+                        return True
+                    
                     # Method 3: Force click with position if needed
                     try:
                         await best_match.click(force=True)
@@ -407,26 +407,21 @@ class FormInteraction:
                         is_closed = await self._verify_dropdown_closed(dropdown_selectors)
                         if is_closed:
                             logger.debug("Dropdown closed after force click")
-                    return True
-            except Exception as e:
+                            return True
+                    except Exception as e:
                         logger.debug(f"Force click failed: {e}")
-                        
+                    
                     logger.warning("Dropdown remains open after multiple click attempts")
                     return False
-                    
-            except Exception as e:
+                
+                except Exception as e:
                     logger.error(f"Error clicking option: {e}")
                     return False
-                    
+            
             else:
                 similarity_info = ""
                 if best_match:
-                    try:
-                        option_text = await best_match.text_content()
-                        option_text = option_text.strip() if option_text else ""
-                        similarity_info = f" (best match: '{option_text}' with score {best_score})"
-                    except:
-                        pass
+                    similarity_info = f" (best match: '{best_match_text}' with score {best_score})"
                 logger.warning(f"No suitable dropdown option found for '{value}'{similarity_info}")
             return False
             
@@ -462,9 +457,9 @@ class FormInteraction:
                     pass
             
             logger.debug("Dropdown appears to be closed")
-                return True
+            return True
             
-         except Exception as e:
+        except Exception as e:
             logger.debug(f"Error verifying dropdown closed: {e}")
             return True  # Assume closed on error
 
@@ -490,7 +485,7 @@ class FormInteraction:
     ) -> str:
         """Get the current value of a field."""
         try:
-        frame = await self.browser.get_frame(frame_id) if frame_id else self.browser.page
+            frame = await self.browser.get_frame(frame_id) if frame_id else self.browser.page
             element = await frame.query_selector(selector)
             if element:
                 value = await element.input_value()
@@ -573,9 +568,9 @@ class FormInteraction:
             else:
                 frame = await self.browser.get_frame(frame_id) if frame_id else self.browser.page
                 if frame:
-                        await frame.click(selector)
+                    await frame.click(selector)
                     self._log("debug", f"Clicked element {selector} using frame.click")
-                        return True
+                    return True
                 else:
                     self._log("error", f"Failed to find element {selector} for clicking")
             return False
@@ -649,7 +644,7 @@ class FormInteraction:
                     continue
             
             if not dropdown_visible:
-            return False
+                return False
             
             # Try to click a matching option
             return await self._click_dropdown_option(frame, value)
@@ -669,7 +664,7 @@ class FormInteraction:
             if not element:
                 logger.debug(f"Element not found: {selector}")
                 self._log("error", f"Element not found: {selector}")
-            return False
+                return False
             
             # Clear and type value
             await element.fill("")
@@ -682,7 +677,7 @@ class FormInteraction:
             if option_clicked:
                 if await verify_input_value(frame, selector, value, threshold=VERIFICATION_THRESHOLD):
                     return True
-            return False
+                return False
                 
             # If clicking failed, try pressing Enter
             await element.press("Enter")
@@ -856,7 +851,7 @@ class FormInteraction:
                             await asyncio.sleep(0.2)
                         
                         # Check if selection successful
-                        if await verify_selection(frame, selector, value, threshold=threshold):
+                        if await verify_selection(frame, selector, value, threshold=threshold, wait_for_match=False):
                             selection_successful = True
                             break
                 except Exception as e:
@@ -940,9 +935,9 @@ class FormInteraction:
                     selection_successful = True
             
             # Final verification
-            if selection_successful or await verify_selection(frame, selector, value, threshold=threshold):
+            if selection_successful or await verify_selection(frame, selector, value, threshold=threshold, wait_for_match=False):
                 self._log("debug", f"Successfully selected option for '{value}'")
-                            return True
+                return True
                 
             # Always dismiss dropdown as cleanup
             await self._try_dismiss_dropdown(element, frame)
@@ -950,7 +945,7 @@ class FormInteraction:
             # Return best-effort result
             return selection_successful
                     
-                except Exception as e:
+        except Exception as e:
             self._log("error", f"Error in type_and_select_fuzzy: {e}")
             traceback.print_exc()
             
@@ -1039,7 +1034,7 @@ class FormInteraction:
                             frame = await self.browser.get_frame(frame_id) if frame_id else self.browser.page
                             element = await self.element_selector.find_element(selector, frame_id)
                             
-        if element:
+                            if element:
                                 await element.click()
                                 await asyncio.sleep(0.2)
                                 await element.fill("")
@@ -1100,7 +1095,7 @@ class FormInteraction:
                 if await verify_input_value(frame, selector, value, threshold=0.7):
                     return True
                     
-                return False
+            return False
 
         except Exception as e:
             self._log("error", f"Error in keyboard navigation retry: {e}")
@@ -1114,8 +1109,8 @@ class FormInteraction:
             # Try direct click
             try:
                 await frame.click(selector, timeout=2000)
-                        return True
-                except Exception:
+                return True
+            except Exception:
                 pass
                 
             # Try JavaScript click
@@ -1132,11 +1127,11 @@ class FormInteraction:
                 element = await self.element_selector.find_element(selector, frame_id)
                 if element:
                     await element.press("Enter")
-                return True
+                    return True
             except Exception:
                 pass
                 
-                return False
+            return False
             
         except Exception as e:
             self._log("error", f"Error in button click retry: {e}")
@@ -1179,9 +1174,9 @@ class FormInteraction:
                         if option_elements:
                             options.extend(option_elements)
                             break
-                except Exception as e:
+                    except Exception as e:
                         logger.debug(f"Error finding options with selector {selector}: {e}")
-        except Exception as e:
+            except Exception as e:
                 logger.debug(f"Error finding dropdown options: {e}")
                 
         return options
@@ -1202,7 +1197,7 @@ class FormInteraction:
             # Check if the values match or if expected value is contained in current value
             if current_value == expected_value or expected_value in current_value:
                 logger.debug(f"Verification successful: Current value '{current_value}' matches expected '{expected_value}'")
-                    return True
+                return True
                 
             logger.debug(f"Verification failed: Current value '{current_value}' does not match expected '{expected_value}'")
             return False
@@ -1247,7 +1242,7 @@ class FormInteraction:
             
             if best_match:
                 logger.debug(f"Best match found with score {best_score}")
-                 else:
+            else:
                 logger.debug(f"No match found above threshold {threshold}")
 
         except Exception as e:
@@ -1257,8 +1252,8 @@ class FormInteraction:
 
     async def _is_element_visible(self, element, frame_id=None):
         """Check if an element is visible in the current frame."""
-            try:
-                frame = await self.browser.get_frame(frame_id) if frame_id else self.browser.page
+        try:
+            frame = await self.browser.get_frame(frame_id) if frame_id else self.browser.page
             is_visible = await frame.evaluate("""el => {
                 const style = window.getComputedStyle(el);
                 return style.display !== 'none' &&
@@ -1268,7 +1263,7 @@ class FormInteraction:
                        el.offsetHeight > 0;
             }""", element)
             return is_visible
-            except Exception as e:
+        except Exception as e:
             logger.debug(f"Error checking element visibility: {e}")
             return False
 
@@ -1286,12 +1281,12 @@ class FormInteraction:
             element = await frame.wait_for_selector(selector, timeout=5000)
             if not element:
                 logger.debug(f"Dropdown element not found: {selector}")
-            return False
+                return False
 
             if use_keyboard:
                 # Use keyboard to select the value
                 await self.type_and_select_option(selector, value, frame_id)
-        else:
+            else:
                 # Use mouse to select the value
                 await self.select_option(selector, value, None, frame_id)
 
@@ -11,12 +11,60 @@ from enterprise_job_agent.tools.constants import VERIFICATION_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
-async def verify_selection(frame: Frame, selector: str, expected_value: str, threshold: float = VERIFICATION_THRESHOLD) -> bool:
+# How long the browser polls a custom widget for the selection to show up before the slower checks run
+SELECTION_WAIT_TIMEOUT = 300  # ms
+
+# "match" once the element shows the expected value: equal, or one containing the other with the
+# shorter at least half as long (so "no" doesn't match "not applicable"). A native <select> is
+# compared by its selected option's label or value and answers at once, since its state is
+# already final; only custom widgets keep being polled (falsy) until they match or time out.
+SELECTION_MATCHES_JS = """
+([sel, exp]) => {
+    const e = document.querySelector(sel);
+    if (!e) return false;
+    const x = exp.toLowerCase().trim();
+    const matches = (text) => {
+        const v = (text || '').toLowerCase().trim();
+        if (!v || !x) return false;
+        if (v === x) return true;
+        const [shorter, longer] = v.length <= x.length ? [v, x] : [x, v];
+        return 2 * shorter.length >= longer.length && longer.includes(shorter);
+    };
+    if (e.tagName === 'SELECT') {
+        const o = e.options[e.selectedIndex];
+        return o && (matches(o.text) || matches(o.value)) ? 'match' : 'no-match';
+    }
+    return matches(e.value || e.textContent) ? 'match' : false;
+}
+"""
+
+async def verify_selection(
+    frame: Frame,
+    selector: str,
+    expected_value: str,
+    threshold: float = VERIFICATION_THRESHOLD,
+    *,
+    wait_for_match: bool = True
+) -> bool:
     """Verify that a dropdown or similar selection was successful.
 
     Prioritizes checking the input value, then falls back to text content and JS evaluation.
+    With wait_for_match, a direct match is first awaited in the browser for up to
+    SELECTION_WAIT_TIMEOUT; pass False when only the threshold checks should decide.
     """
     try:
+        # 0. Let the browser poll for a direct match while the widget settles
+        if wait_for_match:
+            try:
+                handle = await frame.wait_for_function(
+                    SELECTION_MATCHES_JS, arg=[selector, expected_value], timeout=SELECTION_WAIT_TIMEOUT
+                )
+                if await handle.json_value() == "match":
+                    logger.debug(f"VerifySelection: '{selector}' shows '{expected_value}'")
+                    return True
+            except Exception as wait_e:
+                logger.debug(f"VerifySelection: No direct match for {selector}, falling back to fuzzy checks: {str(wait_e)}")
+
         # 1. Verify Input Value (Most reliable for inputs/selects)
         if await verify_input_value(frame, selector, expected_value, threshold):
             return True